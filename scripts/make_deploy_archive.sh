@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+#
+# Copyright (c) 2023, Miquel Massot
+# All rights reserved.
+# Licensed under the GPLv3 License.
+# See LICENSE.md file in the project root for full license information.
+#
+# Build a bytecode-only archive of pyvoyis for deployment on vehicles.
+#
+# The package is copied to a staging folder, compiled with optimisation
+# level 2 into legacy .pyc files next to each module, and the .py sources are
+# removed from the copy. The archive has to be used with the same Python
+# minor version that built it.
+#
+# Usage: scripts/make_deploy_archive.sh [output.tar.gz]
+
+set -euo pipefail
+
+PYTHON=${PYTHON:-python3}
+ROOT_DIR=$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)
+PY_TAG=$("$PYTHON" -c 'import sys; print("py%d%d" % sys.version_info[:2])')
+OUTPUT=${1:-"$ROOT_DIR/dist/pyvoyis-$PY_TAG-bytecode.tar.gz"}
+
+STAGING=$(mktemp -d)
+trap 'rm -rf "$STAGING"' EXIT
+
+cp -r "$ROOT_DIR/src/pyvoyis" "$STAGING/"
+find "$STAGING" -name "__pycache__" -type d -prune -exec rm -rf {} +
+
+"$PYTHON" -m compileall -q -b -o 2 "$STAGING/pyvoyis"
+find "$STAGING/pyvoyis" -name "*.py" -delete
+
+mkdir -p "$(dirname "$OUTPUT")"
+tar -czf "$OUTPUT" -C "$STAGING" pyvoyis
+echo "Wrote $OUTPUT"
@@ -5,28 +5,81 @@ Licensed under the GPLv3 License.
 See LICENSE.md file in the project root for full license information.
 """
 
-from .api import VoyisAPI  # noqa: F401
-from .commander import VoyisCommander  # noqa: F401
-from .configuration import Configuration  # noqa: F401
-from .messages import (  # noqa: F401, F403
-    AckRsp,
-    API500Message,
-    APIConfiguration,
-    APIConfigurationNot,
-    APIStatus,
-    APIStatusNot,
-    ApiVersionNot,
-    ConnectionChangeNot,
-    CorrectionModelListNot,
-    CorrectionModelLoadNot,
-    EndpointConfiguration,
-    EndpointConfigurationNot,
-    LeakDetectionNot,
-    PendingCmdStatusNot,
-    ScannerListNot,
-    ScannerParameter,
-    ScannerParametersNot,
-    ScannerStatus,
-    ScannerStatusNot,
-    ValueHistory,
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import messages  # noqa: F401
+    from .api import VoyisAPI  # noqa: F401
+    from .commander import VoyisCommander  # noqa: F401
+    from .configuration import Configuration  # noqa: F401
+
+# Exported names, and in the same order the submodule that defines each one.
+# Submodules are only imported the first time one of their names is accessed.
+__all__ = (
+    "VoyisAPI",
+    "VoyisCommander",
+    "Configuration",
+    "messages",
+)
+_MODULES = (
+    ".api",
+    ".commander",
+    ".configuration",
+    ".messages",
 )
+_LAZY = dict(zip(__all__, _MODULES))
+# The message classes live in pyvoyis.messages (e.g. pyvoyis.messages.AckRsp).
+# They are still resolved from the top-level package for backward compatibility.
+_LAZY.update(
+    dict.fromkeys(
+        (
+            "AckRsp",
+            "API500Message",
+            "APIConfiguration",
+            "APIConfigurationNot",
+            "APIStatus",
+            "APIStatusNot",
+            "ApiVersionNot",
+            "ConnectionChangeNot",
+            "CorrectionModelListNot",
+            "CorrectionModelLoadNot",
+            "EndpointConfiguration",
+            "EndpointConfigurationNot",
+            "LeakDetectionNot",
+            "PendingCmdStatusNot",
+            "ScannerListNot",
+            "ScannerParameter",
+            "ScannerParametersNot",
+            "ScannerStatus",
+            "ScannerStatusNot",
+            "ValueHistory",
+        ),
+        ".messages",
+    )
+)
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # Only read the installed distribution metadata when asked for
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("pyvoyis")
+        except PackageNotFoundError:
+            value = "unknown"
+        globals()[name] = value
+        return value
+    if name not in _LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module = importlib.import_module(_LAZY[name], __name__)
+    # Submodules are returned as they are, other names are looked up in them
+    value = module if name == "messages" else getattr(module, name)
+    # Cache the value so later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
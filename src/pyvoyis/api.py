@@ -9,13 +9,18 @@ import asyncio
 import datetime
 import logging
 import os
+import queue
 import threading
 import time
-from pathlib import Path
+from collections import deque
 
-import nest_asyncio
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML was built without libyaml
+    from yaml import SafeDumper
+
 from pyvoyis.api500 import API500Client
 from pyvoyis.api500.defs import (
     API_PARAM_STILLS_ADVANCED_ADAPTIVE_LIGHTING,
@@ -97,14 +102,245 @@ from pyvoyis.messages import (
 from pyvoyis.state_machine import VoyisAPIStateMachine
 from pyvoyis.tools.bool2str import bool2str
 from pyvoyis.tools.custom_logger import setup_logging
-from pyvoyis.tools.rate import Rate
 from pyvoyis.tools.safe_get import safe_get
 from pyvoyis.tools.str2bool import str2bool
 
-nest_asyncio.apply()
+# Text of a device flag in the system checks, indexed by the flag
+_CONNECTED_STR = ("NOT Connected", "Connected")
+_READY_STR = ("NOT Ready", "Ready")
+
+
+def _bool_to_digit(b):
+    return ("0", "1")[bool(b)]
 
 
 class VoyisAPI:
+    # Number of notifications of each kind kept in the *_list attributes
+    _HISTORY_LENGTH = 1024
+
+    # Message type, class that parses it, list attribute that keeps the messages
+    _LISTED_MESSAGES = (
+        ("ApiVersionNot", ApiVersionNot, "api_version_not_list"),
+        ("APIStatus", APIStatus, "api_status_list"),
+        ("ConnectionChangeNot", ConnectionChangeNot, "connection_change_not_list"),
+        ("ScannerStatus", ScannerStatus, "scanner_status_list"),
+        ("LeakDetectionNot", LeakDetectionNot, "leak_detection_not_list"),
+        ("ScannerParameter", ScannerParameter, "scanner_parameter_list"),
+        ("APIConfiguration", APIConfiguration, "api_configuration_list"),
+        ("EndpointConfiguration", EndpointConfiguration, "endpoint_configuration_list"),
+        (
+            "CorrectionModelLoadNot",
+            CorrectionModelLoadNot,
+            "correction_model_load_not_list",
+        ),
+        (
+            "CorrectionModelListNot",
+            CorrectionModelListNot,
+            "correction_model_list_not_list",
+        ),
+        ("PendingCmdStatusNot", PendingCmdStatusNot, "pending_cmd_status_not_list"),
+    )
+
+    # Snapshot name -> dict written to <date>_<name>.yaml in the log folder
+    _SNAPSHOTS = {
+        "api_status_not": "api_status_not_dict",
+        "scanner_status_not": "scanner_status_not_dict",
+        "scanner_parameters_not": "scanner_parameters_not_dict",
+        "api_configuration_not": "api_configuration_not_dict",
+        "endpoint_configuration_not": "endpoint_configuration_not_dict",
+    }
+    # Minimum time in seconds between two writes of the snapshot files
+    _SNAPSHOT_PERIOD_S = 1.0
+
+    # Endpoint id, field of config.endpoint_id with its file name, max file size
+    _ENDPOINTS = (
+        (ENDPOINT_ID_LOG, "log", 1024 * 1024 * 1024),
+        (ENDPOINT_ID_STREAM, "stream", 1024 * 1024 * 1024),
+        (ENDPOINT_ID_XYZ_LASER, "xyz_laser", 1024 * 1024 * 1024),
+        (ENDPOINT_ID_SENSOR_LASER, "sensor_laser", 0),
+        (ENDPOINT_ID_SENSOR_STILLS_RAW, "sensor_stills_raw", 0),
+        (ENDPOINT_ID_SENSOR_STILLS_PROCESSED, "sensor_stills_processed", 0),
+    )
+
+    # Device name, scanner status ids for its connected and ready flags, and
+    # whether config.parameters uses the device, i.e. it has to be ready
+    _DEVICE_STATUS = (
+        ("API", SCANNER_STATUS_CONNECTED, SCANNER_STATUS_READY, lambda c: True),
+        (
+            "Stills camera",
+            SCANNER_STATUS_STILLS_CAMERA_CONNECTED,
+            SCANNER_STATUS_STILLS_CAMERA_READY,
+            lambda c: c.stills_freq_hz > 0,
+        ),
+        (
+            "Laser camera",
+            SCANNER_STATUS_LASER_CAMERA_CONNECTED,
+            SCANNER_STATUS_LASER_CAMERA_READY,
+            lambda c: c.laser_freq_hz > 0,
+        ),
+        (
+            "Laser",
+            SCANNER_STATUS_LASER_CONNECTED,
+            SCANNER_STATUS_LASER_READY,
+            lambda c: c.laser_freq_hz > 0 and c.laser_gain_percentage > 0,
+        ),
+        (
+            "LED panel",
+            SCANNER_STATUS_LED_PANEL_CONNECTED,
+            SCANNER_STATUS_LED_PANEL_READY,
+            lambda c: c.stills_freq_hz > 0 and c.led_panel_intensity_percentage > 0,
+        ),
+    )
+
+    # Scanner status id and the question its value answers about the laser
+    _LASER_STATUS = (
+        (SCANNER_STATUS_LASER_CONNECTED, "Laser connected?"),
+        (SCANNER_STATUS_LASER_READY, "Laser ready?"),
+        (SCANNER_STATUS_LASER_DONGLE_AT_CH, "Laser dongle connected?"),
+        (SCANNER_STATUS_LASER_INHIBIT_ENABLED, "Laser inhibited?"),
+    )
+
+    # Label and scanner status id of the temperatures logged before scanning
+    _TEMPERATURE_STATUS = (("cpu_temp_ch", SCANNER_STATUS_CPU_TEMP_CH),)
+
+    # Scanner parameter id, value built from config.parameters, value type
+    _SCANNER_PARAMETERS = (
+        (
+            SCANNER_PARAM_PROFILE_STILLS_EXP,
+            lambda c: str(c.stills_exp_us),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_LASER_FREQ,
+            lambda c: str(int(c.laser_freq_hz * 1000)),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_STILL_FREQ,
+            lambda c: str(int(c.stills_freq_hz * 1000)),
+            VALUE_TYPE_UINT,
+        ),
+        # If true, laser freq is 1 Hz
+        (
+            SCANNER_PARAM_OUTPUT_LASER_DATA,
+            lambda c: bool2str(c.save_laser_images),
+            VALUE_TYPE_BOOL,
+        ),
+        (SCANNER_PARAM_MEMS_OUTPUT_ENABLE, lambda c: "false", VALUE_TYPE_BOOL),
+        (
+            SCANNER_PARAM_LASER_MIN_RANGE,
+            lambda c: str(c.laser_min_range_cm),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_LASER_DISABLE_RANGE_GATING,
+            lambda c: bool2str(c.laser_disable_range_gating),
+            VALUE_TYPE_BOOL,
+        ),
+        (
+            SCANNER_PARAM_LASER_MAX_RANGE,
+            lambda c: str(c.laser_max_range_cm),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_INDEX_OF_REFRACTION,
+            lambda c: str(int(c.index_of_refraction * 1e6)),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_LED_PANEL_INTENSITY,
+            lambda c: str(c.led_panel_intensity_percentage),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_LASER_OUTPUT_GAIN,
+            lambda c: str(c.laser_gain_percentage),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_STILLS_IMAGE_LEVEL,
+            lambda c: str(c.stills_image_level),
+            VALUE_TYPE_UINT,
+        ),
+        (
+            SCANNER_PARAM_STILLS_IMAGE_UNDISTORT,
+            lambda c: bool2str(c.stills_undistort, "true", "false"),
+            VALUE_TYPE_BOOL,
+        ),
+    )
+
+    # API configuration parameter id, field of config.parameters, formatter of
+    # the field value, value type
+    _API_PARAMETERS = (
+        (
+            API_PARAM_STILLS_IMAGE_UNDISTORT,
+            "stills_undistort",
+            _bool_to_digit,
+            VALUE_TYPE_UINT,
+        ),
+        (API_PARAM_STILLS_IMAGE_LEVEL, "stills_image_level", str, VALUE_TYPE_UINT),
+        (
+            API_PARAM_STILLS_IMAGE_SAVE_ORIGINAL,
+            "stills_save_original",
+            bool2str,
+            VALUE_TYPE_BOOL,
+        ),
+        (
+            API_PARAM_STILLS_PROCESSED_IMAGE_FORMAT,
+            "stills_processed_image_format_uint",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_COLOUR_MODE,
+            "stills_advanced_colour_mode",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_COLOUR_ENHANCEMENT_LVL,
+            "stills_advanced_colour_enhancement_lvl",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_CONTRAST_MODE,
+            "stills_advanced_contrast_mode",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_CONTRAST_LVL,
+            "stills_advanced_contrast_lvl",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_BRIGHTNESS,
+            "stills_advanced_brightness",
+            "{:.2f}".format,
+            VALUE_TYPE_FLOAT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_CONTRAST,
+            "stills_advanced_contrast",
+            "{:.2f}".format,
+            VALUE_TYPE_FLOAT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_WHITE_BALANCE,
+            "stills_advanced_white_balance",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+        (
+            API_PARAM_STILLS_ADVANCED_ADAPTIVE_LIGHTING,
+            "stills_advanced_adaptive_lighting",
+            str,
+            VALUE_TYPE_UINT,
+        ),
+    )
+
     def __init__(self, config):
         """Class to handle the Voyis API"""
         self.config = config
@@ -116,40 +352,106 @@ class VoyisAPI:
         self.event = threading.Event()
         self.task_set = set()
 
-        # Handle RuntimeError: There is no current event loop in thread 'Thread-1'.
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError as e:
-            if str(e).startswith("There is no current event loop in thread"):
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-            else:
-                raise
-
-        self.client = API500Client(self.ip, self.port, self.loop, self.task_set)
+        # The event loop and the client are created by run()
+        self.loop = None
+        self.client = None
         self.state = VoyisAPIStateMachine()
         self.cmd = VoyisCommander()
 
         self.last_connection_state = 0
 
+        # Payloads sent more than once, built once for this instance. The
+        # commands are shared by every VoyisAPI, so they are assigned to the
+        # command right before sending. Scanning is started in profiling mode.
+        self._start_scanner_payload = {"mode": 0}
+        self._sync_time_payload = {"microseconds_since_epoch": 0}
+
         self.api_status_not_dict = {}
         self.scanner_list_not_dict = {}
         self.scanner_parameters_not_dict = {}
         self.scanner_status_not_dict = {}
         self.api_configuration_not_dict = {}
         self.endpoint_configuration_not_dict = {}
-
-        self.api_version_not_list = []
-        self.api_status_list = []
-        self.connection_change_not_list = []
-        self.leak_detection_not_list = []
-        self.correction_model_load_not_list = []
-        self.correction_model_list_not_list = []
-        self.pending_cmd_status_not_list = []
-        self.ack_rsp_list = []
+        # Names of the snapshots to write, consumed by snapshot_writer_thread
+        self._snapshot_q = queue.SimpleQueue()
+
+        # Only the most recent notifications of each kind are kept
+        self.api_version_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.api_status_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.connection_change_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.scanner_status_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.leak_detection_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.scanner_parameter_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.api_configuration_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.endpoint_configuration_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.correction_model_load_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.correction_model_list_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        self.pending_cmd_status_not_list = deque(maxlen=self._HISTORY_LENGTH)
+        # AckRsp are matched to commands in the order they were sent
+        self.ack_rsp_list = deque(maxlen=256)
+        # Notified every time an AckRsp is received
+        self._ack_cv = threading.Condition()
+        # Notified every time scanner_status_not_dict is updated
+        self._status_cv = threading.Condition()
+        # Set once the first ScannerListNot has been processed
+        self._scanner_list_event = threading.Event()
+
+        # API configuration parameters waiting to be sent by flush_api_config()
+        self._pending_api_params = []
 
         self._request_acquisition = False
         self._request_stop = False
+        # Set to run the next state machine step without waiting
+        self._wake = threading.Event()
+
+        # Message type -> (message class, append of the list that keeps it)
+        self._message_lists = {
+            message: (message_class, getattr(self, list_name).append)
+            for message, message_class, list_name in self._LISTED_MESSAGES
+        }
+        # Message type -> method handling any other message
+        self._message_handlers = {
+            "APIStatusNot": self._handle_api_status_not,
+            "ScannerListNot": self._handle_scanner_list_not,
+            "ScannerStatusNot": self._handle_scanner_status_not,
+            "ScannerParametersNot": self._handle_scanner_parameters_not,
+            "APIConfigurationNot": self._handle_api_configuration_not,
+            "EndpointConfigurationNot": self._handle_endpoint_configuration_not,
+            "AckRsp": self._handle_ack_rsp,
+        }
+
+        # State id -> method run by infinite_loop while in that state
+        self._state_handlers = {
+            self.state.idling.value: self._on_idling,
+            self.state.connecting.value: self._on_connecting,
+            self.state.configuring.value: self._on_configuring,
+            self.state.readying.value: self._on_readying,
+            self.state.requesting_acquisition.value: self._on_requesting_acquisition,
+            self.state.acquiring.value: self._on_acquiring,
+            self.state.requesting_stop.value: self._on_requesting_stop,
+            self.state.stopping.value: self._on_stopping,
+            self.state.disconnecting.value: self._on_disconnecting,
+        }
+
+    def setup_event_loop(self):
+        """Create the asyncio event loop and the API500 client"""
+        uvloop = None
+        if self.config.use_uvloop:
+            try:
+                import uvloop
+            except ImportError:
+                self.log.warning(
+                    "use_uvloop is set but uvloop is not installed, "
+                    "using the asyncio event loop"
+                )
+
+        # Always a new loop, it is set as the current one in asyncio_thread
+        if uvloop is not None:
+            self.loop = uvloop.new_event_loop()
+        else:
+            self.loop = asyncio.new_event_loop()
+
+        self.client = API500Client(self.ip, self.port, self.loop, self.task_set)
 
     def start_logging(self):
         # Set default path and logging
@@ -157,15 +459,41 @@ class VoyisAPI:
         current_date = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         mp = current_date + "_" + self.config.endpoint_id.mission_postfix
         self.default_path = os.path.join(bp, mp)
+        # The endpoints do not change for the whole session
+        self._endpoints_payload = [
+            {
+                "endpoint_id": endpoint_id,
+                "net_enabled": False,
+                "net_connection": "",
+                "file_enabled": True,
+                "file_name": os.path.join(
+                    self.default_path, getattr(self.config.endpoint_id, field)
+                ),
+                "file_max_bytes": file_max_bytes,
+            }
+            for endpoint_id, field, file_max_bytes in self._ENDPOINTS
+        ]
         logging_folder = os.path.join(self.config.log_path, mp, "pyvoyis_logs")
 
         print("Setting up logging in: ", logging_folder)
         setup_logging(logging_folder)
+        # Snapshots are saved next to the log file and named after its date
+        self._log_file = logging.getLoggerClass().root.handlers[0].baseFilename
+        log_stem = os.path.splitext(os.path.basename(self._log_file))[0]
+        self._date_str = "_".join(log_stem.split("_")[0:2])
+        self._snapshot_files = {
+            name: os.path.join(
+                os.path.dirname(self._log_file), self._date_str + "_" + name + ".yaml"
+            )
+            for name in self._SNAPSHOTS
+        }
 
         # Copy configuration file to logging folder
         new_file = os.path.join(logging_folder, "pyvoyis.yaml")
         with open(new_file, "w") as f:
-            yaml.dump(self.config.dict(), f, default_flow_style=False)
+            yaml.dump(
+                self.config.dict(), f, Dumper=SafeDumper, default_flow_style=False
+            )
         print(self.config)
 
         self.log = logging.getLogger("VoyisAPI")
@@ -174,10 +502,12 @@ class VoyisAPI:
     def request_acquisition(self):
         """Request acquisition"""
         self._request_acquisition = True
+        self._wake.set()
 
     def request_stop(self):
         """Request stop"""
         self._request_stop = True
+        self._wake.set()
 
     def send_message(self, cmd, timeout_s=10.0, retries=2, expect_ack=True):
         """Sends a message to the API500Client
@@ -187,7 +517,11 @@ class VoyisAPI:
         cmd : API500Command
             Command to send
         timeout_s : float, optional
-            Timeout in seconds to wait for the AckRsp, by default 6.0
+            Timeout in seconds to wait for the AckRsp, by default 10.0
+        retries : int, optional
+            Number of attempts if no AckRsp is received, by default 2
+        expect_ack : bool, optional
+            Wait for an AckRsp after sending, by default True
 
         Returns
         -------
@@ -196,30 +530,83 @@ class VoyisAPI:
         """
         if retries <= 0:
             return False
-        len_ack_before = len(self.ack_rsp_list)
-        self.loop.run_until_complete(self.client.send_message(cmd.to_str()))
+        if expect_ack:
+            # Drop acks left over from commands nobody waited for, otherwise
+            # they would be taken as the ack for this command
+            with self._ack_cv:
+                self.ack_rsp_list.clear()
+        self._submit(cmd, timeout_s)
         if not expect_ack:
             return True
         # Wait for AckRsp to be received
-        timeout_start = time.time()
-        while time.time() < timeout_start + timeout_s:
-            if len(self.ack_rsp_list) == len_ack_before + 1:
-                break
-            time.sleep(0.1)
-        if len(self.ack_rsp_list) > 0:
-            ack_rsp = self.ack_rsp_list.pop()
-            if not ack_rsp.accepted:
-                self.log.error(
-                    "Command {} not accepted: {}".format(
-                        cmd.command, ack_rsp.nack_error_string
-                    )
-                )
-            elif ack_rsp.accepted:
-                self.log.info("Command {} accepted!".format(cmd.command))
-            return ack_rsp.accepted
+        acks = self._wait_for_acks(1, timeout_s)
+        if len(acks) > 0:
+            return self._check_ack(cmd, acks[0])
         else:
-            self.send_message(cmd, timeout_s=timeout_s, retries=retries - 1)
-            return False
+            self.log.warning("No AckRsp received for %s", cmd.command)
+            # Back off a little longer after each failed attempt
+            time.sleep(min(0.5 * 2 ** (2 - retries), 2.0))
+            return self.send_message(cmd, timeout_s=timeout_s, retries=retries - 1)
+
+    def send_messages_batch(self, cmds, timeout_s=10.0):
+        """Sends several messages back to back and waits for all their AckRsp
+
+        The AckRsp are matched to the commands in the order they arrive. The
+        commands left without one are sent again with send_message(), which
+        retries them on its own.
+
+        Parameters
+        ----------
+        cmds : list of API500Command
+            Commands to send, in order
+        timeout_s : float, optional
+            Timeout in seconds to wait for all the AckRsp, by default 10.0
+
+        Returns
+        -------
+        list of bool
+            For each command, True if it was accepted, False otherwise
+        """
+        with self._ack_cv:
+            self.ack_rsp_list.clear()
+        for cmd in cmds:
+            self._submit(cmd, timeout_s)
+        acks = self._wait_for_acks(len(cmds), timeout_s)
+        results = [self._check_ack(cmd, ack) for cmd, ack in zip(cmds, acks)]
+        for cmd in cmds[len(acks) :]:
+            self.log.warning("No AckRsp received for %s", cmd.command)
+            results.append(self.send_message(cmd, timeout_s=timeout_s))
+        return results
+
+    def _submit(self, cmd, timeout_s):
+        """Queue a command on the client from outside the event loop"""
+        # The loop runs in asyncio_thread, hand the coroutine over to it
+        future = asyncio.run_coroutine_threadsafe(
+            self.client.send_message(cmd.to_str()), self.loop
+        )
+        future.result(timeout=timeout_s)
+
+    def _wait_for_acks(self, count, timeout_s):
+        """Wait for count AckRsp and return the ones received, oldest first"""
+        with self._ack_cv:
+            self._ack_cv.wait_for(lambda: len(self.ack_rsp_list) >= count, timeout_s)
+            count = min(count, len(self.ack_rsp_list))
+            return [self.ack_rsp_list.popleft() for _ in range(count)]
+
+    def _check_ack(self, cmd, ack_rsp):
+        """Log whether the command was accepted and return it"""
+        if not ack_rsp.accepted:
+            self.log.error(
+                "Command %s not accepted (command_id %s): %s",
+                cmd.command,
+                ack_rsp.command_id,
+                ack_rsp.nack_error_string,
+            )
+        else:
+            self.log.info(
+                "Command %s accepted! (command_id %s)", cmd.command, ack_rsp.command_id
+            )
+        return ack_rsp.accepted
 
     def get_received_messages(self):
         """Get the received messages from the API500Client
@@ -244,11 +631,20 @@ class VoyisAPI:
         # Stop the listen_api_thread
         self.event.set()
         self.listen_api_thread.join()
-
+        # Snapshots are only queued when a value changes, write them all once
+        # more so the files also record the last time each value was reported
+        for name, dict_name in self._SNAPSHOTS.items():
+            if getattr(self, dict_name):
+                self._snapshot_q.put(name)
+        # Let the snapshot_writer_thread write what is left and exit
+        self._snapshot_q.put(None)
+        self.snapshot_writer_thread.join()
+
+        # The loop is owned by asyncio_thread, schedule these calls on it
         for t in self.task_set:
-            t.cancel()
+            self.loop.call_soon_threadsafe(t.cancel)
 
-        self.loop.stop()
+        self.loop.call_soon_threadsafe(self.loop.stop)
 
         # Stop the asyncio_thread
         self.asyncio_thread.join()
@@ -261,101 +657,128 @@ class VoyisAPI:
             self.state.reset()
             return
 
-        if self.state.is_idling:
-            self.state.connect()
-        elif self.state.is_connecting:
-            success = self.query_api_version()
-            if not success:
-                self.log.error("Could not query API version")
-                return
-            success = self.connect_to_scanner()
-            if not success:
-                self.log.error("Could not connect to scanner")
-                return
-            success = self.check_connection_status()
-            if not success:
-                self.log.error("Could not check connection status")
-                return
-            self.state.configure()
-        elif self.state.is_configuring:
-            success = self.configure_time_source()
-            if not success:
-                self.log.error(
-                    "Could not configure time source."\
-                    "Check that the IP address provided for time sync is accessible"\
-                    "from the Voyis API PC network."
-                )
-                return
-            success = self.configure_nav()
-            if not success:
-                self.log.error(
-                    "Could not configure nav. Check that the IP address provided for"\
-                    "nav updates is accessible from the Voyis PC network.",
-                )
-                return
-            success = self.set_data_options()
-            if not success:
-                self.log.error("Could not set data options")
-                return
-            # Necessary to be able to read armed / temperatures
-            success = self.get_scanner_status()
-            if not success:
-                self.log.error("Could not get scanner status")
-                return
-            success = self.perform_system_checks()
-            if not success:
-                self.log.error("Could not perform system checks or some checks failed")
-                return
-            success = self.stop_scanning_if_running()
-            if not success:
-                self.log.error("Could not stop scanning")
-            success = self.set_scan_parameters()
-            if not success:
-                self.log.error("Could not set scan parameters")
-                return
-            success = self.check_laser_is_armed()
-            if not success:
-                self.log.error("Could not check laser is armed")
-                return
-            success = self.check_temperatures()
-            if not success:
-                self.log.error("Could not check temperatures")
-                return
-            self.state.ready()
-        if self.state.is_readying and self._request_acquisition:
+        handler = self._state_handlers.get(self.state.current_state_value)
+        if handler is not None:
+            handler()
+
+    def _on_idling(self):
+        """Start connecting to the API"""
+        self.state.connect()
+
+    def _on_connecting(self):
+        """Query the API version and connect to the scanner"""
+        success = self.query_api_version()
+        if not success:
+            self.log.error("Could not query API version")
+            return
+        success = self.connect_to_scanner()
+        if not success:
+            self.log.error("Could not connect to scanner")
+            return
+        success = self.check_connection_status()
+        if not success:
+            self.log.error("Could not check connection status")
+            return
+        self.state.configure()
+
+    def _on_configuring(self):
+        """Configure the scanner and check it is ready to scan"""
+        success = self.configure_time_source()
+        if not success:
+            self.log.error(
+                "Could not configure time source."\
+                "Check that the IP address provided for time sync is accessible"\
+                "from the Voyis API PC network."
+            )
+            return
+        success = self.configure_nav()
+        if not success:
+            self.log.error(
+                "Could not configure nav. Check that the IP address provided for"\
+                "nav updates is accessible from the Voyis PC network.",
+            )
+            return
+        success = self.set_data_options()
+        if not success:
+            self.log.error("Could not set data options")
+            return
+        # Necessary to be able to read armed / temperatures
+        success = self.get_scanner_status()
+        if not success:
+            self.log.error("Could not get scanner status")
+            return
+        success = self.perform_system_checks()
+        if not success:
+            self.log.error("Could not perform system checks or some checks failed")
+            return
+        success = self.stop_scanning_if_running()
+        if not success:
+            self.log.error("Could not stop scanning")
+        success = self.set_scan_parameters()
+        if not success:
+            self.log.error("Could not set scan parameters")
+            return
+        success = self.check_laser_is_armed()
+        if not success:
+            self.log.error("Could not check laser is armed")
+            return
+        success = self.check_temperatures()
+        if not success:
+            self.log.error("Could not check temperatures")
+            return
+        self.state.ready()
+        # Do not wait for the next iteration to handle an acquisition request
+        self._on_readying()
+
+    def _on_readying(self):
+        """Wait for an acquisition request"""
+        if self._request_acquisition:
             self._request_acquisition = False
             self.state.request_acquisition()
-        elif self.state.is_requesting_acquisition:
-            success = self.start_scanning()
-            if not success:
-                self.log.error("Could not start scanning")
-                return
-            self.state.acquire()
-        elif self.state.is_acquiring:
-            success = self.get_scanner_status()
-            if not success:
-                self.log.error("Could not get scanner status")
-                return
-            if self._request_stop:
-                self._request_stop = False
-                self.state.request_stop()
-        elif self.state.is_requesting_stop:
-            success = self.stop_scanning()
-            if not success:
-                self.log.error("Could not stop scanning")
-                return
-            self.state.stop()
-        elif self.state.is_stopping:
-            self.state.disconnect()
-        elif self.state.is_disconnecting:
-            success = self.disconnect()
-            if not success:
-                self.log.error("Could not disconnect")
-                return
-            self.state.reset()
+
+    def _on_requesting_acquisition(self):
+        """Start scanning"""
+        success = self.start_scanning()
+        if not success:
+            self.log.error("Could not start scanning")
+            return
+        self.state.acquire()
+
+    def _on_acquiring(self):
+        """Poll the scanner status until a stop is requested"""
+        success = self.get_scanner_status()
+        if not success:
+            self.log.error("Could not get scanner status")
+            return
+        if self._request_stop:
+            self._request_stop = False
+            self.state.request_stop()
+
+    def _on_requesting_stop(self):
+        """Stop scanning"""
+        success = self.stop_scanning()
+        if not success:
+            self.log.error("Could not stop scanning")
+            return
+        self.state.stop()
+
+    def _on_stopping(self):
+        """Start disconnecting from the scanner"""
+        self.state.disconnect()
+
+    def _on_disconnecting(self):
+        """Disconnect from the scanner and go back to idling"""
+        success = self.disconnect()
+        if not success:
+            self.log.error("Could not disconnect")
+            return
+        self.state.reset()
 
     def run(self):
         """Main function to run the API client"""
+        if self.loop is None:
+            self.setup_event_loop()
+
         self.asyncio_thread = threading.Thread(target=self.asyncio_thread_fn)
         self.asyncio_thread.start()
 
@@ -363,41 +786,86 @@ class VoyisAPI:
         self.listen_api_thread = threading.Thread(target=self.listen_api_thread_fn)
         self.listen_api_thread.start()
 
+        # Snapshot files are written in the background, away from the listener
+        self.snapshot_writer_thread = threading.Thread(
+            target=self.snapshot_writer_thread_fn
+        )
+        self.snapshot_writer_thread.start()
+
         try:
             while not self.client.connected:
                 time.sleep(1)
             while True:
-                self.log.info("[State]: {}".format(self.state.current_state_value))
+                self.log.info("[State]: %s", self.state.current_state_value)
+                state = self.state.current_state
+                self._wake.clear()
                 self.infinite_loop()
-                time.sleep(1)
+                if self.state.current_state is state or not self.client.connected:
+                    # Nothing to do until a request arrives or the next check
+                    self._wake.wait(1.0)
         except KeyboardInterrupt:
             self.shutdown()
 
     def asyncio_thread_fn(self):
         """Thread to run the asyncio loop"""
+        asyncio.set_event_loop(self.loop)
         task = self.loop.create_task(self.client.connect())
         self.task_set.add(task)
         try:
             # run_forever() returns after calling loop.stop()
             self.loop.run_forever()
-            for t in [t for t in self.task_set if not (t.done() or t.cancelled())]:
+            pending = [t for t in self.task_set if not t.done()]
+            if pending:
                 # give canceled tasks the last chance to run
-                self.loop.run_until_complete(t)
+                self.loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
         finally:
             self.loop.close()
             self.log.info("Stopped")
 
     def listen_api_thread_fn(self):
         """Thread to listen to the API and process incomming messages"""
-        rate = Rate(1)
-        while True:
-            received = self.get_received_messages()
-            if len(received) > 0:
-                for msg in received:
-                    self.process_message(msg)
-            rate.sleep()
-            if self.event.is_set():
-                break
+        # The client does not change while this thread runs
+        get_message = self.client.get_message
+        drain_received = self.client.drain_received
+        process_message = self.process_message
+        while not self.event.is_set():
+            # Block until a message arrives, waking up regularly to check the event
+            try:
+                msg = get_message(timeout=0.5)
+            except queue.Empty:
+                continue
+            process_message(msg)
+            # Handle whatever arrived meanwhile before blocking again
+            for msg in drain_received():
+                process_message(msg)
+
+    def snapshot_writer_thread_fn(self):
+        """Thread to write the snapshot files queued by the message handlers
+
+        Every snapshot queued since the last write is written once, and the
+        thread then waits _SNAPSHOT_PERIOD_S before the next write. A None
+        in the queue writes what is pending and stops the thread.
+        """
+        running = True
+        while running:
+            names = {self._snapshot_q.get()}
+            while True:
+                try:
+                    names.add(self._snapshot_q.get_nowait())
+                except queue.Empty:
+                    break
+            if None in names:
+                names.discard(None)
+                running = False
+            for name in names:
+                try:
+                    self._write_snapshot(name)
+                except OSError as e:
+                    self.log.warning("Could not write %s snapshot: %s", name, e)
+            if running:
+                self.event.wait(self._SNAPSHOT_PERIOD_S)
 
     def connect_to_scanner(self):
         """Connect to scanner
@@ -413,7 +881,10 @@ class VoyisAPI:
             self.log.warn("Command list_scanners was not successful")
             return False
 
+        # The commands are shared by every VoyisAPI, set the address before
+        # sending. It does not change while retrying the connection below.
         self.cmd.check_for_scanner.payload = {"ip_address": self.ip}
+        self.cmd.connect_scanner.payload = {"ip_address": self.ip}
         success = self.send_message(self.cmd.check_for_scanner)
 
         if not success:
@@ -421,7 +892,6 @@ class VoyisAPI:
             return False
 
         while not self.is_scanner_connected():
-            self.cmd.connect_scanner.payload = {"ip_address": self.ip}
             success = self.send_message(self.cmd.connect_scanner)
             if not success:
                 self.log.warn("Command connect_scanner was not successful")
@@ -453,75 +923,18 @@ class VoyisAPI:
         """
         self.log.info("[VoyisAPI]: Setting data options...")
 
-        success = self.send_message(self.cmd.disable_nas)
-        success = self.send_message(self.cmd.disable_local_storage)
+        self.cmd.set_endpoints.payload = self._endpoints_payload
 
-        self.cmd.set_endpoints.payload = [
-            {
-                "endpoint_id": ENDPOINT_ID_LOG,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.log
-                ),
-                "file_max_bytes": 1024 * 1024 * 1024,
-            },
-            {
-                "endpoint_id": ENDPOINT_ID_STREAM,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.stream
-                ),
-                "file_max_bytes": 1024 * 1024 * 1024,
-            },
-            {
-                "endpoint_id": ENDPOINT_ID_XYZ_LASER,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.xyz_laser
-                ),
-                "file_max_bytes": 1024 * 1024 * 1024,
-            },
-            {
-                "endpoint_id": ENDPOINT_ID_SENSOR_LASER,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.sensor_laser
-                ),
-                "file_max_bytes": 0,
-            },
-            {
-                "endpoint_id": ENDPOINT_ID_SENSOR_STILLS_RAW,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.sensor_stills_raw
-                ),
-                "file_max_bytes": 0,
-            },
-            {
-                "endpoint_id": ENDPOINT_ID_SENSOR_STILLS_PROCESSED,
-                "net_enabled": False,
-                "net_connection": "",
-                "file_enabled": True,
-                "file_name": os.path.join(
-                    self.default_path, self.config.endpoint_id.sensor_stills_processed
-                ),
-                "file_max_bytes": 0,
-            },
-        ]
-
-        success = self.send_message(self.cmd.set_endpoints)
-        if not success:
-            return False
+        # Send all three commands before waiting for their acks. As before,
+        # only setting the endpoints has to succeed.
+        results = self.send_messages_batch(
+            [
+                self.cmd.disable_nas,
+                self.cmd.disable_local_storage,
+                self.cmd.set_endpoints,
+            ]
+        )
+        success = results[-1]
 
         # self.send_message(self.cmd.query_endpoint_configuration) does not work
         return success
@@ -543,22 +956,22 @@ class VoyisAPI:
         # self.cmd.check_for_scanner.payload = {"ip_address": self.ip}
         # self.send_message(self.cmd.check_for_scanner)
 
-        while len(self.scanner_list_not_dict) == 0:
-            time.sleep(1)
+        # Wake up as soon as the first ScannerListNot is processed
+        while not self._scanner_list_event.wait(1.0):
             self.log.info("Waiting for ScannerListNot")
             if not self.client.connected:
                 return False
 
-        scanner_connection_state = int(safe_get(self.scanner_list_not_dict, self.ip))
+        scanner_connection_state = safe_get(self.scanner_list_not_dict, self.ip)
         if scanner_connection_state is None:
             self.log.warning("Scanner not found in ScannerListNot")
             return False
+        scanner_connection_state = int(scanner_connection_state)
 
         self.log.debug("[VoyisAPI]: Scanner found in ScannerListNot")
         self.log.info(
-            "[VoyisAPI]: Scanner connection state: {}".format(
-                scanner_connection_to_str(scanner_connection_state)
-            )
+            "[VoyisAPI]: Scanner connection state: %s",
+            scanner_connection_to_str(scanner_connection_state),
         )
 
         if scanner_connection_state < SCANNER_NOT_READY:
@@ -567,25 +980,37 @@ class VoyisAPI:
 
         return scanner_connection_state == SCANNER_CONNECTED_TO_THIS_API
 
-    def wait_for_scanning_status(self, expected_value):
-        status_achieved = False
-        while not status_achieved:
+    def wait_for_scanning_status(self, expected_value, timeout_s=30.0, query=True):
+        """Wait until the scanner reports the expected scan in progress status
+
+        Parameters
+        ----------
+        expected_value : bool
+            Value of SCANNER_STATUS_SCAN_IN_PROGRESS to wait for
+        timeout_s : float, optional
+            Timeout in seconds, by default 30.0
+        query : bool, optional
+            Ask the scanner for its status first, by default True. Otherwise
+            only the notifications already on their way are waited for.
+
+        Returns
+        -------
+        bool
+            True if the status was reached, False on timeout
+        """
+
+        def status_achieved():
+            res = self.scanner_status_not_dict.get(SCANNER_STATUS_SCAN_IN_PROGRESS)
+            return res is not None and str2bool(res.value.get()) == expected_value
+
+        self.log.info(
+            "Waiting for SCANNER_STATUS_SCAN_IN_PROGRESS to become %s", expected_value
+        )
+        # Ask for the status once, process_message notifies on every update
+        if query:
             self.get_scanner_status()
-            if SCANNER_STATUS_SCAN_IN_PROGRESS not in self.scanner_status_not_dict:
-                continue
-            res = str2bool(
-                self.scanner_status_not_dict[
-                    SCANNER_STATUS_SCAN_IN_PROGRESS
-                ].value.get()
-            )
-            if res == expected_value:
-                break
-            self.log.info(
-                "Waiting for SCANNER_STATUS_SCAN_IN_PROGRESS to become {}".format(
-                    expected_value
-                )
-            )
-            time.sleep(5)
+        with self._status_cv:
+            return self._status_cv.wait_for(status_achieved, timeout=timeout_s)
 
     def stop_scanning_if_running(self):
         """Helper function to stop scanning if it is running
@@ -599,7 +1024,13 @@ class VoyisAPI:
             success = self.stop_scanning()
             if success: 
                 break
-            time.sleep(1)
+            # The stop is refused when nothing is scanning. The scanner sends
+            # its status after a stop, wait at most a second for it to report
+            # not scanning before retrying. Querying the status could block
+            # for the whole send_message() timeout and retries instead.
+            if self.wait_for_scanning_status(False, timeout_s=1.0, query=False):
+                success = True
+                break
         #if not success:
         #    self.wait_for_scanning_status(False)
         """
@@ -627,14 +1058,12 @@ class VoyisAPI:
             True if all checks were successful, False otherwise
         """
         self.log.info("[VoyisAPI]: Performing system checks...")
-        # Check parameter notifications
-        success = self.send_message(self.cmd.query_scanner_parameters)
-        if not success:
-            return False
-
-        # Upon reception of this command, API will generate scanner status notification
-        success = self.send_message(self.cmd.query_scanner_status)
-        if not success:
+        # Check parameter notifications. Upon reception of the status query, API
+        # will generate scanner status notification. Both are sent back to back.
+        results = self.send_messages_batch(
+            [self.cmd.query_scanner_parameters, self.cmd.query_scanner_status]
+        )
+        if not all(results):
             return False
 
         # Check current FPS
@@ -653,82 +1082,36 @@ class VoyisAPI:
             "SCANNER_STATUS_STILLS_SENSOR_ACTUAL_FPS: {}".format(res.value.get()))
         """
 
-        api_connected = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_CONNECTED)
-        api_ready = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_READY)
-
-        stills_cam_connected = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_STILLS_CAMERA_CONNECTED
-        )
-        stills_cam_ready = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_STILLS_CAMERA_READY
-        )
-
-        laser_cam_connected = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LASER_CAMERA_CONNECTED
-        )
-        laser_cam_ready = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LASER_CAMERA_READY
-        )
-
-        laser_connected = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LASER_CONNECTED
-        )
-        laser_ready = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_LASER_READY)
-
-        led_panel_connected = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LED_PANEL_CONNECTED
-        )
-        led_panel_ready = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LED_PANEL_READY
-        )
-
+        # Convert each status to a boolean once, missing statuses count as False
+        get = self.scanner_status_not_dict.get
+        status = {}
+        for _, connected_key, ready_key, _ in self._DEVICE_STATUS:
+            for key in (connected_key, ready_key):
+                res = get(key)
+                if res is None:
+                    self.log.warning("Scanner status %s NOT FOUND", key)
+                    status[key] = False
+                else:
+                    status[key] = str2bool(res.value.get())
+
+        # Only the devices the configuration uses have to be ready
+        cfg = self.config.parameters
+        ready = True
         self.log.info("[VoyisAPI]: Device status:")
-        self.log.info(
-            "  * API: {} {}".format(
-                "Connected" if str2bool(api_connected.value.get()) else "NOT Connected",
-                "Ready" if str2bool(api_ready.value.get()) else "NOT Ready",
-            )
-        )
-        self.log.info(
-            "  * Stills camera: {} {}".format(
-                "Connected"
-                if str2bool(stills_cam_connected.value.get())
-                else "NOT Connected",
-                "Ready" if str2bool(stills_cam_ready.value.get()) else "NOT Ready",
-            )
-        )
-        self.log.info(
-            "  * Laser camera: {} {}".format(
-                "Connected"
-                if str2bool(laser_cam_connected.value.get())
-                else "NOT Connected",
-                "Ready" if str2bool(laser_cam_ready.value.get()) else "NOT Ready",
-            )
-        )
-        self.log.info(
-            "  * Laser: {} {}".format(
-                "Connected"
-                if str2bool(laser_connected.value.get())
-                else "NOT Connected",
-                "Ready" if str2bool(laser_ready.value.get()) else "NOT Ready",
-            )
-        )
-        self.log.info(
-            "  * LED panel: {} {}".format(
-                "Connected"
-                if str2bool(led_panel_connected.value.get())
-                else "NOT Connected",
-                "Ready" if str2bool(led_panel_ready.value.get()) else "NOT Ready",
+        for device, connected_key, ready_key, used in self._DEVICE_STATUS:
+            if used(cfg):
+                ready = ready and status[ready_key]
+                note = ""
+            else:
+                note = " (not used)"
+            self.log.info(
+                "  * %s: %s %s%s",
+                device,
+                _CONNECTED_STR[status[connected_key]],
+                _READY_STR[status[ready_key]],
+                note,
             )
-        )
-
-        return (
-            api_ready
-            and stills_cam_ready
-            and laser_cam_ready
-            and laser_ready
-            and led_panel_ready
-        )
+        return ready
 
     def configure_time_source(self):
         """Sends command to configure time source
@@ -787,157 +1170,48 @@ class VoyisAPI:
         self.log.info("[VoyisAPI]: Setting scan parameters...")
         cfg = self.config.parameters
         self.cmd.set_local_scanner_parameters.payload = [
-            {
-                "parameter_id": SCANNER_PARAM_PROFILE_STILLS_EXP,
-                "value": str(cfg.stills_exp_us),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LASER_FREQ,
-                "value": str(int(cfg.laser_freq_hz * 1000)),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_STILL_FREQ,
-                "value": str(int(cfg.stills_freq_hz * 1000)),
-                "type": VALUE_TYPE_UINT,
-            },
-            {  # If true, laser freq is 1 Hz
-                "parameter_id": SCANNER_PARAM_OUTPUT_LASER_DATA,
-                "value": bool2str(cfg.save_laser_images),
-                "type": VALUE_TYPE_BOOL,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_MEMS_OUTPUT_ENABLE,
-                "value": "false",
-                "type": VALUE_TYPE_BOOL,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LASER_MIN_RANGE,
-                "value": str(cfg.laser_min_range_cm),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LASER_DISABLE_RANGE_GATING,
-                "value": bool2str(cfg.laser_disable_range_gating),
-                "type": VALUE_TYPE_BOOL,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LASER_MAX_RANGE,
-                "value": str(cfg.laser_max_range_cm),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_INDEX_OF_REFRACTION,
-                "value": str(int(cfg.index_of_refraction * 1e6)),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LED_PANEL_INTENSITY,
-                "value": str(cfg.led_panel_intensity_percentage),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_LASER_OUTPUT_GAIN,
-                "value": str(cfg.laser_gain_percentage),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_STILLS_IMAGE_LEVEL,
-                "value": str(cfg.stills_image_level),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": SCANNER_PARAM_STILLS_IMAGE_UNDISTORT,
-                "value": bool2str(cfg.stills_undistort, "true", "false"),
-                "type": VALUE_TYPE_BOOL,
-            },
+            {"parameter_id": parameter_id, "value": value(cfg), "type": value_type}
+            for parameter_id, value, value_type in self._SCANNER_PARAMETERS
         ]
 
         success = self.send_message(self.cmd.set_local_scanner_parameters)
         if not success:
+            self.log.warn("Could not set local scanner parameters")
             return False
-
+        # Only apply the scanner parameters once they have been accepted
         success = self.send_message(self.cmd.apply_local_scanner_parameters)
         if not success:
-            return False
-
-        success = self.send_message(self.cmd.query_api_configuration)
-        if not success:
+            self.log.warn("Could not apply local scanner parameters")
             return False
 
         self.log.info("[VoyisAPI]: Setting stills parameters...")
-        self.cmd.set_api_configuration.payload = [
-            {
-                "parameter_id": API_PARAM_STILLS_IMAGE_UNDISTORT,
-                "value": bool2str(cfg.stills_undistort, "1", "0"),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_IMAGE_LEVEL,
-                "value": str(cfg.stills_image_level),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_IMAGE_SAVE_ORIGINAL,
-                "value": bool2str(cfg.stills_save_original, "true", "false"),
-                "type": VALUE_TYPE_BOOL,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_PROCESSED_IMAGE_FORMAT,
-                "value": str(cfg.stills_processed_image_format_uint),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_COLOUR_MODE,
-                "value": str(cfg.stills_advanced_colour_mode),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_COLOUR_ENHANCEMENT_LVL,
-                "value": str(cfg.stills_advanced_colour_enhancement_lvl),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_CONTRAST_MODE,
-                "value": str(cfg.stills_advanced_contrast_mode),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_CONTRAST_LVL,
-                "value": str(cfg.stills_advanced_contrast_lvl),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_BRIGHTNESS,
-                "value": "{:.2f}".format(cfg.stills_advanced_brightness),
-                "type": VALUE_TYPE_FLOAT,
-            },
+        self._pending_api_params.extend(
             {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_CONTRAST,
-                "value": "{:.2f}".format(cfg.stills_advanced_contrast),
-                "type": VALUE_TYPE_FLOAT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_WHITE_BALANCE,
-                "value": str(cfg.stills_advanced_white_balance),
-                "type": VALUE_TYPE_UINT,
-            },
-            {
-                "parameter_id": API_PARAM_STILLS_ADVANCED_ADAPTIVE_LIGHTING,
-                "value": str(cfg.stills_advanced_adaptive_lighting),
-                "type": VALUE_TYPE_UINT,
-            },
-        ]
-        success = self.send_message(self.cmd.set_api_configuration)
-        if not success:
-            return False
+                "parameter_id": parameter_id,
+                "value": formatter(getattr(cfg, field)),
+                "type": value_type,
+            }
+            for parameter_id, field, formatter, value_type in self._API_PARAMETERS
+        )
+        return self.flush_api_config()
 
-        success = self.send_message(self.cmd.query_api_configuration)
-        if not success:
-            return False
+    def flush_api_config(self):
+        """Sends all the pending API configuration parameters in one command
 
-        return True
+        The configuration is queried right behind it, without waiting for the
+        first AckRsp, so the notifications reflect every parameter that was set.
+
+        Returns
+        -------
+        bool
+            True if the commands were successful, False otherwise
+        """
+        if len(self._pending_api_params) == 0:
+            return True
+        self.cmd.set_api_configuration.payload = self._pending_api_params
+        self._pending_api_params = []
+        cmds = [self.cmd.set_api_configuration, self.cmd.query_api_configuration]
+        return all(self.send_messages_batch(cmds))
 
     def check_laser_is_armed(self):
         """Helper function to check if the laser is armed
@@ -950,29 +1224,20 @@ class VoyisAPI:
         self.log.info("[VoyisAPI]: Checking laser is armed...")
 
         # Check laser safety / inhibit
-        res = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_LASER_CONNECTED)
-        if res is not None:
-            self.log.info("[VoyisAPI]: Laser connected? {}".format(res.value.get()))
-
-        res = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_LASER_READY)
-        if res is not None:
-            self.log.info("[VoyisAPI]: Laser ready? {}".format(res.value.get()))
+        get = self.scanner_status_not_dict.get
+        for key, question in self._LASER_STATUS:
+            res = get(key)
+            if res is None:
+                self.log.warning("Scanner status %s NOT FOUND", key)
+            else:
+                self.log.info("[VoyisAPI]: %s %s", question, res.value.get())
 
-        res = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_LASER_DONGLE_AT_CH)
-        if res is not None:
-            self.log.info(
-                "[VoyisAPI]: Laser dongle connected? {}".format(res.value.get())
+        res = get(SCANNER_STATUS_LASER_SAFETY_DISABLED)
+        if res is None:
+            self.log.warning(
+                "Scanner status %s NOT FOUND", SCANNER_STATUS_LASER_SAFETY_DISABLED
             )
-
-        res = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LASER_INHIBIT_ENABLED
-        )
-        if res is not None:
-            self.log.info("[VoyisAPI]: Laser inhibited? {}".format(res.value.get()))
-        res = safe_get(
-            self.scanner_status_not_dict, SCANNER_STATUS_LASER_SAFETY_DISABLED
-        )
-        if res is not None:
+        else:
             if res.value:
                 self.log.info("[VoyisAPI]: Laser key: DISARM")
             else:
@@ -989,11 +1254,15 @@ class VoyisAPI:
         """
         self.log.info("[VoyisAPI]: Checking temperatures")
         # Check temperatures
-        cpu_temp_ch = safe_get(self.scanner_status_not_dict, SCANNER_STATUS_CPU_TEMP_CH)
+        get = self.scanner_status_not_dict.get
 
         self.log.info("Temperature readings:")
-        if cpu_temp_ch is not None:
-            self.log.info("  * cpu_temp_ch: {} C".format(cpu_temp_ch.value.get()))
+        for label, key in self._TEMPERATURE_STATUS:
+            res = get(key)
+            if res is None:
+                self.log.warning("Scanner status %s NOT FOUND", key)
+            else:
+                self.log.info("  * %s: %s C", label, res.value.get())
         return True
 
     def start_scanning(self):
@@ -1005,8 +1274,7 @@ class VoyisAPI:
             True if the command was successful, False otherwise
         """
         self.log.info("[VoyisAPI]: Start scanning...")
-        # Set mode to profiling
-        self.cmd.start_scanner.payload = {"mode": 0}
+        self.cmd.start_scanner.payload = self._start_scanner_payload
         return self.send_message(self.cmd.start_scanner)
 
     def stop_scanning(self):
@@ -1070,202 +1338,119 @@ class VoyisAPI:
         data : dict
             Message data
         """
-        # Handle logging
-        logging_file = Path(logging.getLoggerClass().root.handlers[0].baseFilename)
-        date_str = "_".join(logging_file.stem.split("_")[0:2])
-
         message = data["message"]
-        if message == "ApiVersionNot":
-            try:
-                msg_class = ApiVersionNot(data)
-                self.api_version_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "APIStatus":
-            try:
-                msg_class = APIStatus(data)
-                self.api_status_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "APIStatusNot":
-            try:
-                msg_class = APIStatusNot(data)
-                for asn in msg_class.statuses:
-                    if asn.status_id in self.api_status_not_dict:
-                        self.api_status_not_dict[asn.status_id].update(asn)
-                    else:
-                        self.api_status_not_dict[asn.status_id] = asn
-                # Save dict as json
-                api_status_not_file = logging_file.parent / (
-                    date_str + "_api_status_not.yaml"
-                )
-                if api_status_not_file.exists():
-                    # delete the file
-                    api_status_not_file.unlink()
-                with api_status_not_file.open("a", encoding="utf-8") as f:
-                    for key in self.api_status_not_dict:
-                        val = self.api_status_not_dict[key]
-                        f.write(val.to_yaml())
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ScannerListNot":
-            try:
-                msg_class = ScannerListNot(data)
-                for idx in range(msg_class.size()):
-                    self.scanner_list_not_dict[
-                        msg_class.ip_addresses[idx]
-                    ] = msg_class.connection_states[idx]
-                self.last_connection_state = int(
-                    safe_get(self.scanner_list_not_dict, self.ip)
-                )
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ConnectionChangeNot":
-            try:
-                msg_class = ConnectionChangeNot(data)
-                self.connection_change_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ScannerStatus":
-            try:
-                msg_class = ScannerStatus(data)
-                self.scanner_status_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ScannerStatusNot":
-            try:
-                msg_class = ScannerStatusNot(data)
-                for ssnot in msg_class.statuses:
-                    if ssnot.status_id in self.scanner_status_not_dict:
-                        self.scanner_status_not_dict[ssnot.status_id].update(ssnot)
-                    else:
-                        self.scanner_status_not_dict[ssnot.status_id] = ssnot
-                # Save dict as json
-                scanner_status_not_file = logging_file.parent / (
-                    date_str + "_scanner_status_not.yaml"
-                )
-                if scanner_status_not_file.exists():
-                    # delete the file
-                    scanner_status_not_file.unlink()
-                with scanner_status_not_file.open("a", encoding="utf-8") as f:
-                    for key in self.scanner_status_not_dict:
-                        val = self.scanner_status_not_dict[key]
-                        f.write(val.to_yaml())
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "LeakDetectionNot":
-            try:
-                msg_class = LeakDetectionNot(data)
-                self.leak_detection_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ScannerParameter":
-            try:
-                msg_class = ScannerParameter(data)
-                self.scanner_parameter_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "ScannerParametersNot":
-            try:
-                msg_class = ScannerParametersNot(data)
-                for spnot in msg_class.parameters:
-                    if spnot.parameter_id in self.scanner_parameters_not_dict:
-                        self.scanner_parameters_not_dict[spnot.parameter_id].update(
-                            spnot
-                        )
-                    else:
-                        self.scanner_parameters_not_dict[spnot.parameter_id] = spnot
-                # Save dict as json
-                scanner_parameters_not_file = logging_file.parent / (
-                    date_str + "_scanner_parameters_not.yaml"
-                )
-                if scanner_parameters_not_file.exists():
-                    # delete the file
-                    scanner_parameters_not_file.unlink()
-                with scanner_parameters_not_file.open("a", encoding="utf-8") as f:
-                    for key in self.scanner_parameters_not_dict:
-                        val = self.scanner_parameters_not_dict[key]
-                        f.write(val.to_yaml())
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "APIConfiguration":
-            try:
-                msg_class = APIConfiguration(data)
-                self.api_configuration_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "APIConfigurationNot":
-            try:
-                msg_class = APIConfigurationNot(data)
-                for acnot in msg_class.api_configurations:
-                    self.api_configuration_not_dict[acnot.parameter_id] = acnot
-                # Save dict as json
-                logging_file = Path(
-                    logging.getLoggerClass().root.handlers[0].baseFilename
-                )
-                api_configuration_not_file = logging_file.parent / (
-                    date_str + "_api_configuration_not.yaml"
-                )
-                if api_configuration_not_file.exists():
-                    # delete the file
-                    api_configuration_not_file.unlink()
-                with api_configuration_not_file.open("a", encoding="utf-8") as f:
-                    for key in self.api_configuration_not_dict:
-                        val = self.api_configuration_not_dict[key]
-                        f.write(val.to_yaml())
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "EndpointConfiguration":
-            try:
-                msg_class = EndpointConfiguration(data)
-                self.endpoint_configuration_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "EndpointConfigurationNot":
-            try:
-                msg_class = EndpointConfigurationNot(data)
-                for ecnot in msg_class.endpoint_configurations:
-                    self.endpoint_configuration_not_dict[ecnot.endpoint_id] = ecnot
-                # Save dict as json
-                endpoint_configuration_not_file = logging_file.parent / (
-                    date_str + "_endpoint_configuration_not.yaml"
-                )
-                if endpoint_configuration_not_file.exists():
-                    # delete the file
-                    endpoint_configuration_not_file.unlink()
-                with endpoint_configuration_not_file.open("a", encoding="utf-8") as f:
-                    for key in self.endpoint_configuration_not_dict:
-                        val = self.endpoint_configuration_not_dict[key]
-                        f.write(val.to_yaml())
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "CorrectionModelLoadNot":
-            try:
-                msg_class = CorrectionModelLoadNot(data)
-                self.correction_model_load_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "CorrectionModelListNot":
-            try:
-                msg_class = CorrectionModelListNot(data)
-                self.correction_model_list_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "PendingCmdStatusNot":
-            try:
-                msg_class = PendingCmdStatusNot(data)
-                self.pending_cmd_status_not_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
-        elif message == "AckRsp":
-            try:
-                msg_class = AckRsp(data)
-                self.ack_rsp_list.append(msg_class)
-            except Exception as e:
-                self.log.warn("Could not parse ScannerStatus: {}".format(e))
+        try:
+            listed = self._message_lists.get(message)
+            if listed is not None:
+                message_class, append = listed
+                append(message_class(data))
+                return
+            handler = self._message_handlers.get(message)
+            if handler is not None:
+                handler(data)
+        except Exception as e:
+            self.log.warning("Could not parse %s: %s", message, e)
+
+    def _merge_snapshot(self, name, entries, key, merge=True):
+        """Stores notification entries in a snapshot dict
+
+        The snapshot file is queued for snapshot_writer_thread if any entry
+        was added or changed.
+
+        Parameters
+        ----------
+        name : str
+            Snapshot name, a key of _SNAPSHOTS
+        entries : list
+            Entries of the notification
+        key : str
+            Attribute of the entries used as key in the snapshot dict
+        merge : bool, optional
+            Add the values to the stored entry with update() instead of
+            replacing it, by default True
+        """
+        snapshot = getattr(self, self._SNAPSHOTS[name])
+        changed = False
+        for entry in entries:
+            entry_id = getattr(entry, key)
+            stored = snapshot.get(entry_id) if merge else None
+            if stored is not None:
+                changed |= stored.update(entry)
+            else:
+                snapshot[entry_id] = entry
+                changed = True
+        if changed:
+            self._snapshot_q.put(name)
+
+    def _write_snapshot(self, name):
+        """Replace a snapshot file with the current content of its dict"""
+        # Copy the entries, the listener thread keeps adding to the dict
+        values = list(getattr(self, self._SNAPSHOTS[name]).values())
+        path = self._snapshot_files[name]
+        # Write next to the file and swap it in, readers never see half a file
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(val.to_yaml() for val in values)
+        os.replace(tmp_path, path)
+
+    def _handle_api_status_not(self, data):
+        """Handle an APIStatusNot message"""
+        msg_class = APIStatusNot(data)
+        self._merge_snapshot("api_status_not", msg_class.statuses, "status_id")
+
+    def _handle_scanner_list_not(self, data):
+        """Handle a ScannerListNot message"""
+        msg_class = ScannerListNot(data)
+        for idx in range(msg_class.size()):
+            self.scanner_list_not_dict[msg_class.ip_addresses[idx]] = (
+                msg_class.connection_states[idx]
+            )
+        self._scanner_list_event.set()
+        self.last_connection_state = int(safe_get(self.scanner_list_not_dict, self.ip))
+
+    def _handle_scanner_status_not(self, data):
+        """Handle a ScannerStatusNot message"""
+        msg_class = ScannerStatusNot(data)
+        with self._status_cv:
+            self._merge_snapshot("scanner_status_not", msg_class.statuses, "status_id")
+            self._status_cv.notify_all()
+
+    def _handle_scanner_parameters_not(self, data):
+        """Handle a ScannerParametersNot message"""
+        msg_class = ScannerParametersNot(data)
+        self._merge_snapshot(
+            "scanner_parameters_not", msg_class.parameters, "parameter_id"
+        )
+
+    def _handle_api_configuration_not(self, data):
+        """Handle an APIConfigurationNot message"""
+        msg_class = APIConfigurationNot(data)
+        self._merge_snapshot(
+            "api_configuration_not",
+            msg_class.api_configurations,
+            "parameter_id",
+            merge=False,
+        )
+
+    def _handle_endpoint_configuration_not(self, data):
+        """Handle an EndpointConfigurationNot message"""
+        msg_class = EndpointConfigurationNot(data)
+        self._merge_snapshot(
+            "endpoint_configuration_not",
+            msg_class.endpoint_configurations,
+            "endpoint_id",
+            merge=False,
+        )
+
+    def _handle_ack_rsp(self, data):
+        """Handle an AckRsp message"""
+        msg_class = AckRsp(data)
+        with self._ack_cv:
+            self.ack_rsp_list.append(msg_class)
+            self._ack_cv.notify_all()
 
     def sync_time_manually(self):
-        self.cmd.sync_time_manually.payload = {
-            "microseconds_since_epoch": int(time.time() * 1e6)
-        }
+        payload = self._sync_time_payload
+        payload["microseconds_since_epoch"] = time.time_ns() // 1000
+        self.cmd.sync_time_manually.payload = payload
         return self.send_message(self.cmd.sync_time_manually)
@@ -5,5 +5,34 @@ Licensed under the GPLv3 License.
 See LICENSE.md file in the project root for full license information.
 """
 
-from .client import API500Client  # noqa: F401
-from .command import API500Command  # noqa: F401
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import API500Client  # noqa: F401
+    from .command import API500Command  # noqa: F401
+
+# Resolved lazily so that importing pyvoyis.api500.defs (as pyvoyis.messages
+# does) does not import the command module, which itself needs pyvoyis.messages.
+__all__ = (
+    "API500Client",
+    "API500Command",
+)
+_MODULES = (
+    ".client",
+    ".command",
+)
+_LAZY = dict(zip(__all__, _MODULES))
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
@@ -6,28 +6,40 @@ See LICENSE.md file in the project root for full license information.
 """
 
 import asyncio
-import copy
 import json
 import logging
-import sys
+import queue
+import re
 
-if sys.version_info[:2] >= (3, 7):
-    pass
-else:
-    pass
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+# Boundary between two concatenated JSON objects
+_NEXT_OBJECT = re.compile(r"\}\s*\{")
 
 
 class API500ClientProtocol(asyncio.Protocol):
-    def __init__(self, loop):
+    __slots__ = (
+        "log",
+        "transport",
+        "address",
+        "queue",
+        "_ready",
+        "loop",
+        "task",
+        "received",
+        "connected",
+        "data",
+    )
+
+    def __init__(self, loop, received):
         self.log = logging.getLogger("API500ClientProtocol")
         self.transport = None
         self.queue = asyncio.Queue()
         self._ready = asyncio.Event()
         self.loop = loop
         self.task = self.loop.create_task(self._process_queue_loop())
-        # Store received messages here
-        self.received = []
-        self.lock = asyncio.Lock()
+        # Thread-safe queue shared with API500Client, received messages go here
+        self.received = received
         self.connected = False
         self.data = ""
 
@@ -38,7 +50,7 @@ class API500ClientProtocol(asyncio.Protocol):
         while True:
             message = await self.queue.get()
             self.transport.write(message.encode("utf-8"))
-            self.log.debug("Message sent: \n{}".format(message))
+            self.log.debug("Message sent: \n%s", message)
             await asyncio.sleep(0.1)
 
     def connection_made(self, transport):
@@ -60,20 +72,11 @@ class API500ClientProtocol(asyncio.Protocol):
         """Feed a message to the sender coroutine."""
         await self.queue.put(data)
 
-    async def process_data(self, data):
-        # try to parse the data as json
-        try:
-            data = json.loads(data)
-            if "message" not in data:
-                return
-            await self.lock.acquire()
-            self.received.append(data)
-            self.lock.release()
-        except json.JSONDecodeError as e:
-            self.log.error("ERROR: {}".format(e))
-            self.log.error("Offending message:")
-            self.log.error(data)
+    def process_data(self, data):
+        """Hand a decoded message over to API500Client"""
+        if "message" not in data:
             return
+        self.received.put_nowait(data)
 
     def data_received(self, data):
         """After sending a message we expect a reply
@@ -84,70 +87,74 @@ class API500ClientProtocol(asyncio.Protocol):
             channel:        the name of the channel
             channel_count:  the amount of channels subscribed to
         """
-        chunk = data.decode("utf-8")
-        whole_data = ""
+        self.data += data.decode("utf-8")
         # self.log.debug('Received raw chunk: {}'.format(data))
-        if chunk.endswith("\n}"):
-            self.data += chunk
-            whole_data = copy.deepcopy(self.data)
-            self.data = ""
-            self.log.debug("Whole chunk ready")
-        else:
+        if not self.data.endswith("\n}"):
             self.log.debug("Adding chunk to message")
-            self.data += chunk
             return
+        whole_data = self.data
+        self.data = ""
+        self.log.debug("Whole chunk ready")
 
-        # Split data into JSON strings if "}{" is found
-        objects = whole_data.split("}{")
-
-        # Add back the missing brackets
-        if len(objects) > 1:
-            objects[0] = objects[0] + "}"
-            objects[-1] = "{" + objects[-1]
-            for idx in range(1, len(objects) - 1):
-                objects[idx] = "{" + objects[idx] + "}"
-
-        # Process each object
-        for idx, obj in enumerate(objects):
+        # Decode the concatenated JSON objects one after the other, in place
+        idx = 0
+        pos = 0
+        while pos < len(whole_data):
+            pos = _WHITESPACE.match(whole_data, pos).end()
             try:
-                self.log.debug(
-                    "Received split object {}: {}".format(
-                        idx, json.dumps(json.loads(obj))
-                    )
-                )
-                asyncio.ensure_future(self.process_data(obj))
-            except json.decoder.JSONDecodeError:
-                self.log.warn("Could not decode: {}".format(obj))
+                obj, pos = _DECODER.raw_decode(whole_data, pos)
+            except json.JSONDecodeError:
+                # Skip to the next object, the ones after it are still valid
+                boundary = _NEXT_OBJECT.search(whole_data, pos)
+                end = len(whole_data) if boundary is None else boundary.start() + 1
+                self.log.warning("Could not decode: %s", whole_data[pos:end])
+                pos = end
+                continue
+            self.log.debug("Received object %d: %s", idx, obj)
+            self.process_data(obj)
+            idx += 1
 
     def connection_lost(self, error):
         if error:
-            self.log.error("ERROR: {}".format(error))
+            self.log.error("ERROR: %s", error)
         else:
             self.log.warning("The server closed the connection")
         self.connected = False
 
 
 class API500Client:
+    __slots__ = (
+        "ip",
+        "port",
+        "protocol",
+        "transport",
+        "received",
+        "loop",
+        "task_set",
+        "log",
+    )
+
     def __init__(self, ip, port, loop, task_set):
         self.ip = ip
         self.port = port
         self.protocol = None
         self.transport = None
-        self.received = []
+        # Messages received from the server, consumed by another thread
+        self.received = queue.SimpleQueue()
         self.loop = loop
         self.task_set = task_set
         self.log = logging.getLogger("API500Client")
 
     async def connect(self):
-        self.log.info("Connecting to {} port {}".format(self.ip, self.port))
-        self.protocol = API500ClientProtocol(self.loop)
+        self.log.info("Connecting to %s port %s", self.ip, self.port)
+        self.protocol = API500ClientProtocol(self.loop, self.received)
         self.task_set.add(self.protocol.task)
         try:
             task = self.loop.create_task(self.do_connect())
             self.task_set.add(task)
         except ConnectionRefusedError as e:
             self.protocol.task.cancel()
-            self.log.error("ERROR: {}".format(e))
+            self.log.error("ERROR: %s", e)
 
     async def do_connect(self):
         while True:
@@ -174,21 +181,24 @@ class API500Client:
         return self.protocol.connected
 
     async def send_message(self, data):
-        self.log.debug("Queuing message: {!r}".format(data))
+        self.log.debug("Queuing message: %r", data)
         await self.protocol.send_message(data)
 
-    async def thread_safe_get_received_messages(self):
-        """Returns the received messages and clears the list"""
-        if self.protocol is None:
-            return
-        await self.protocol.lock.acquire()
-        self.received = self.protocol.received
-        self.protocol.received = []
-        self.protocol.lock.release()
+    def drain_received(self):
+        """Yields the messages received so far, removing them from the queue"""
+        while True:
+            try:
+                yield self.received.get_nowait()
+            except queue.Empty:
+                return
 
     def get_received_messages(self):
         """Returns the received messages and clears the list"""
-        self.loop.run_until_complete(self.thread_safe_get_received_messages())
-        received = self.received
-        self.received = []
-        return received
+        return list(self.drain_received())
+
+    def get_message(self, timeout=None):
+        """Returns the next received message, blocking up to timeout seconds
+
+        Raises queue.Empty if no message arrived in time.
+        """
+        return self.received.get(timeout=timeout)
@@ -9,6 +9,14 @@ from pyvoyis.messages import API500Message
 
 
 class API500Command:
+    __slots__ = (
+        "command",
+        "payload",
+        "needs_payload",
+        "timeout_s",
+        "expected_response",
+    )
+
     def __init__(
         self, command, needs_payload=False, timeout_s=0, expected_response=None
     ):
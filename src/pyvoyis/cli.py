@@ -8,11 +8,19 @@ See LICENSE.md file in the project root for full license information.
 """
 
 import argparse
+import importlib
+import threading
 
-from pyvoyis import Configuration, VoyisAPI
+
+def preload_modules():
+    """Import the modules needed by main() while the arguments are parsed"""
+    importlib.import_module("pyvoyis.configuration")
+    importlib.import_module("pyvoyis.api")
 
 
 def main():
+    threading.Thread(target=preload_modules, daemon=True).start()
+
     parser = argparse.ArgumentParser(
         description="Run a TCP client to send messages to Voyis API"
     )
@@ -24,7 +32,15 @@ def main():
     )
     args = parser.parse_args()
 
-    config = Configuration(args.config)
+    # Imported after parsing so that --help does not wait for the API to load.
+    # The preload thread has usually finished importing them by now.
+    from pyvoyis.api import VoyisAPI
+    from pyvoyis.configuration import Configuration
+
+    if args.config:
+        config = Configuration.from_file(args.config)
+    else:
+        config = Configuration()
 
     if args.log_path:
         config.log_path = args.log_path
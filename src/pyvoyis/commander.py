@@ -9,6 +9,9 @@ from pyvoyis.api500 import API500Command
 
 
 class VoyisCommander:
+    # The commands are class attributes, instances carry no state of their own
+    __slots__ = ()
+
     ping_api = API500Command("PingApiCmd")
     query_api_version = API500Command(
         "QueryAPIVersionCmd", expected_response=["APIVersionNot"]
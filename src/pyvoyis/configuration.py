@@ -5,10 +5,10 @@ Licensed under the GPLv3 License.
 See LICENSE.md file in the project root for full license information.
 """
 
+import functools
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from pydantic import BaseModel, validator
 
 
@@ -247,6 +247,8 @@ class Configuration(BaseModel):
     ip_address: str = "localhost"
     port: int = 4875
     log_path: str = "logs"
+    # Run the client on uvloop instead of asyncio, needs the uvloop extra
+    use_uvloop: bool = False
 
     def __init__(self, configuration_file: str = None):
         if configuration_file is None:
@@ -258,10 +260,41 @@ class Configuration(BaseModel):
             raise FileNotFoundError(
                 "Configuration file not found at {}".format(configuration_file)
             )
-        stream = configuration_file.open("r")
-        data = yaml.safe_load(stream)
+        # yaml is only needed when a configuration file is given
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML was built without libyaml
+            from yaml import SafeLoader
+
+        with configuration_file.open("r") as stream:
+            data = yaml.load(stream, Loader=SafeLoader)
         super().__init__(**data)
 
+    @classmethod
+    def from_file(cls, configuration_file: str):
+        """Load a configuration file, reusing the parsed result while it is unchanged
+
+        Parameters
+        ----------
+        configuration_file : str
+            Path to the YAML configuration file
+
+        Returns
+        -------
+        Configuration
+            A copy of the cached configuration, safe to modify
+        """
+        configuration_file = Path(configuration_file).resolve()
+        if not configuration_file.exists():
+            raise FileNotFoundError(
+                "Configuration file not found at {}".format(configuration_file)
+            )
+        mtime_ns = configuration_file.stat().st_mtime_ns
+        config = _load_cached(cls, str(configuration_file), mtime_ns)
+        return config.copy(deep=True)
+
     def __str__(self):
         msg = "Configuration: " + self.ip_address
         msg += "\n  ip_address: " + self.ip_address
@@ -269,6 +302,13 @@ class Configuration(BaseModel):
         msg += "\n  navigation_input:" + str(self.navigation_input)
         msg += "\n  pps_input:" + str(self.pps_input)
         msg += "\n  log_path: " + self.log_path
+        msg += "\n  use_uvloop: " + str(self.use_uvloop)
         msg += "\n  parameters: " + str(self.parameters)
         msg += "\n  endpoint_id: " + str(self.endpoint_id)
         return msg
+
+
+@functools.lru_cache(maxsize=16)
+def _load_cached(cls, configuration_file, mtime_ns):
+    """Parse and validate a configuration file once per (path, mtime) pair"""
+    return cls(configuration_file)
@@ -0,0 +1,94 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ack_rsp import AckRsp  # noqa: F401
+    from .api500_message import API500Message, check_keys  # noqa: F401
+    from .api_configuration import APIConfiguration  # noqa: F401
+    from .api_configuration_not import APIConfigurationNot  # noqa: F401
+    from .api_status import APIStatus  # noqa: F401
+    from .api_status_not import APIStatusNot  # noqa: F401
+    from .api_version_not import ApiVersionNot  # noqa: F401
+    from .connection_change_not import ConnectionChangeNot  # noqa: F401
+    from .correction_model_list_not import CorrectionModelListNot  # noqa: F401
+    from .correction_model_load_not import CorrectionModelLoadNot  # noqa: F401
+    from .endpoint_configuration import EndpointConfiguration  # noqa: F401
+    from .endpoint_configuration_not import EndpointConfigurationNot  # noqa: F401
+    from .leak_detection_not import LeakDetectionNot  # noqa: F401
+    from .pending_cmd_status_not import PendingCmdStatusNot  # noqa: F401
+    from .scanner_list_not import ScannerListNot  # noqa: F401
+    from .scanner_parameter import ScannerParameter  # noqa: F401
+    from .scanner_parameters_not import ScannerParametersNot  # noqa: F401
+    from .scanner_status import ScannerStatus  # noqa: F401
+    from .scanner_status_not import ScannerStatusNot  # noqa: F401
+    from .value_history import ValueHistory  # noqa: F401
+
+# One class per submodule, so that using a message type only imports the
+# modules it depends on. _MODULES[i] defines __all__[i].
+__all__ = (
+    "AckRsp",
+    "API500Message",
+    "APIConfiguration",
+    "APIConfigurationNot",
+    "APIStatus",
+    "APIStatusNot",
+    "ApiVersionNot",
+    "check_keys",
+    "ConnectionChangeNot",
+    "CorrectionModelListNot",
+    "CorrectionModelLoadNot",
+    "EndpointConfiguration",
+    "EndpointConfigurationNot",
+    "LeakDetectionNot",
+    "PendingCmdStatusNot",
+    "ScannerListNot",
+    "ScannerParameter",
+    "ScannerParametersNot",
+    "ScannerStatus",
+    "ScannerStatusNot",
+    "ValueHistory",
+)
+_MODULES = (
+    ".ack_rsp",
+    ".api500_message",
+    ".api_configuration",
+    ".api_configuration_not",
+    ".api_status",
+    ".api_status_not",
+    ".api_version_not",
+    ".api500_message",
+    ".connection_change_not",
+    ".correction_model_list_not",
+    ".correction_model_load_not",
+    ".endpoint_configuration",
+    ".endpoint_configuration_not",
+    ".leak_detection_not",
+    ".pending_cmd_status_not",
+    ".scanner_list_not",
+    ".scanner_parameter",
+    ".scanner_parameters_not",
+    ".scanner_status",
+    ".scanner_status_not",
+    ".value_history",
+)
+_LAZY = dict(zip(__all__, _MODULES))
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message, check_keys
+
+
+class AckRsp(API500Message):
+    __slots__ = (
+        "accepted",
+        "command_id",
+        "nack_error_code",
+        "nack_error_string",
+        "api_version",
+    )
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        keys_to_check = [
+            "accepted",
+            "command_id",
+            "nack_error_code",
+            "nack_error_string",
+            "api_version",
+        ]
+        check_keys(self.payload, keys_to_check)
+
+        self.accepted = self.payload["accepted"]
+        self.command_id = self.payload["command_id"]
+        self.nack_error_code = self.payload["nack_error_code"]
+        self.nack_error_string = self.payload["nack_error_string"]
+        self.api_version = self.payload["api_version"]
+
+    def __str__(self):
+        msg = "AckRsp: "
+        msg += " accepted: {}, ".format(self.accepted)
+        msg += " command_id: {}, ".format(self.command_id)
+        msg += " nack_error_code: {}, ".format(self.nack_error_code)
+        msg += " nack_error_string: {}, ".format(self.nack_error_string)
+        msg += " api_version: {}".format(self.api_version)
+        return msg
@@ -0,0 +1,74 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import json
+
+
+def check_keys(json_dict, check_keys):
+    if json_dict is None:
+        raise ValueError("JSON dict is None and should contain", check_keys)
+    for k in check_keys:
+        if k not in json_dict:
+            raise ValueError("Key {} not in json_dict".format(k))
+
+
+class API500Message:
+    __slots__ = ("message", "payload")
+
+    def __init__(self, data=None, message=None, payload=None):
+        """Class to store JSON messages from Voyis API in the form of a dictionary.
+
+        Example:
+        {
+          "message": "SetLocalScannerParametersCmd",
+          "payload": [
+            {
+              "parameter_id": 0,
+              "value": "false",
+              "type": 0
+            },
+            {
+              "parameter_id": 15,
+              "value": "150",
+              "type": 3
+            }
+          ]
+        }
+        """
+        keys_to_check = ["message", "payload"]
+        if data is not None:
+            check_keys(data, keys_to_check)
+        self.message = ""
+        self.payload = None
+
+        if message is not None:
+            self.message = message
+        if payload is not None:
+            self.payload = payload
+
+        if data is None:
+            return
+        self.message = data["message"]
+        if "payload" in data:
+            self.payload = data["payload"]
+        if "message" not in data:
+            raise ValueError("Message not in data")
+
+    def to_str(self):
+        if self.payload is None:
+            dict_msg = {
+                "message": self.message,
+            }
+        else:
+            dict_msg = {"message": self.message, "payload": self.payload}
+        return json.dumps(dict_msg)
+
+    def __str__(self):
+        return self.to_json()
+
+    def __repr__(self):
+        return self.__str__()
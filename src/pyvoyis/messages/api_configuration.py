@@ -0,0 +1,68 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.api500.defs import api_param_stills_to_str
+from pyvoyis.messages.api500_message import check_keys
+from pyvoyis.messages.value_history import ValueHistory
+
+
+class APIConfiguration:
+    __slots__ = (
+        "parameter_id",
+        "name",
+        "value_type",
+        "value",
+        "valid_min",
+        "valid_max",
+        "valid_step",
+    )
+
+    def __init__(self, json_dict):
+        keys_to_check = [
+            "parameter_id",
+            "name",
+            "value_type",
+            "value",
+            "valid_min",
+            "valid_max",
+            "valid_step",
+        ]
+        check_keys(json_dict, keys_to_check)
+
+        self.parameter_id = json_dict["parameter_id"]
+        self.name = json_dict["name"]
+        self.value_type = json_dict["value_type"]
+        self.value = ValueHistory(json_dict["value"])
+        self.valid_min = json_dict["valid_min"]
+        self.valid_max = json_dict["valid_max"]
+        self.valid_step = json_dict["valid_step"]
+
+    def update(self, other):
+        return self.value.add(other.value.get())
+
+    def __str__(self):
+        msg = "APIConfiguration: "
+        msg += " parameter_id: {}, ".format(self.parameter_id)
+        msg += " name: {}, ".format(self.name)
+        msg += " value_type: {}, ".format(self.value_type)
+        msg += " value: {}, ".format(self.value)
+        msg += " valid_min: {}, ".format(self.valid_min)
+        msg += " valid_max: {}, ".format(self.valid_max)
+        msg += " valid_step: {}".format(self.valid_step)
+        return msg
+
+    def to_yaml(self):
+        msg = api_param_stills_to_str(self.parameter_id) + ":"
+        msg += "\n    parameter_id: " + str(self.parameter_id)
+        msg += "\n    name: " + str(self.name)
+        msg += "\n    value_type: " + str(self.value_type)
+        msg += "\n    value: " + str(self.value)
+        msg += "\n    valid_min: " + str(self.valid_min)
+        msg += "\n    valid_max: " + str(self.valid_max)
+        msg += "\n    valid_step: " + str(self.valid_step)
+        msg += "\n"
+        return msg
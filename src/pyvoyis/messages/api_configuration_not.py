@@ -0,0 +1,22 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+from pyvoyis.messages.api_configuration import APIConfiguration
+
+
+class APIConfigurationNot(API500Message):
+    __slots__ = ("api_configurations",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.api_configurations = []
+        for p in self.payload:
+            self.api_configurations.append(APIConfiguration(p))
+
+    def __str__(self):
+        return "APIConfigurationNot: {}".format(self.api_configurations)
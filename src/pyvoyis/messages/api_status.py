@@ -0,0 +1,40 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.api500.defs import api_status_to_str
+from pyvoyis.messages.api500_message import check_keys
+from pyvoyis.messages.value_history import ValueHistory
+
+
+class APIStatus:
+    __slots__ = ("status_id", "name", "value_type", "value")
+
+    def __init__(self, json_dict):
+        keys_to_check = ["status_id", "name", "value_type", "value"]
+        check_keys(json_dict, keys_to_check)
+        self.status_id = json_dict["status_id"]
+        self.name = json_dict["name"]
+        self.value_type = json_dict["value_type"]
+        self.value = ValueHistory(json_dict["value"])
+
+    def update(self, other):
+        return self.value.add(other.value.get())
+
+    def __str__(self):
+        msg = "APIStatus: {} ({}) = {}".format(
+            self.name, self.status_id, self.value.get()
+        )
+        return msg
+
+    def to_yaml(self):
+        msg = api_status_to_str(self.status_id) + ":"
+        msg += "\n    status_id: " + str(self.status_id)
+        msg += "\n    name: " + str(self.name)
+        msg += "\n    value_type: " + str(self.value_type)
+        msg += "\n    value: " + str(self.value)
+        msg += "\n"
+        return msg
@@ -0,0 +1,22 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+from pyvoyis.messages.api_status import APIStatus
+
+
+class APIStatusNot(API500Message):
+    __slots__ = ("statuses",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.statuses = []
+        for p in self.payload:
+            self.statuses.append(APIStatus(p))
+
+    def __str__(self):
+        return "APIStatusNot: {}".format(self.statuses)
@@ -0,0 +1,20 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+
+
+class ApiVersionNot(API500Message):
+    __slots__ = ("version", "date")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.version = self.payload["version"]
+        self.date = self.payload["date"]
+
+    def __str__(self):
+        return "ApiVersionNot: {} ({})".format(self.version, self.date)
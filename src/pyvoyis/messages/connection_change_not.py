@@ -0,0 +1,19 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+
+
+class ConnectionChangeNot(API500Message):
+    __slots__ = ("connection_state",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.connection_state = self.payload["connection_state"]
+
+    def __str__(self):
+        return "ConnectionChangeNot: {}".format(self.connection_state)
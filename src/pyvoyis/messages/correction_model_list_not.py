@@ -0,0 +1,28 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message, check_keys
+
+
+class CorrectionModelListNot(API500Message):
+    __slots__ = ("model_limit", "current_model", "model_list")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        keys_to_check = ["model_limit", "current_model", "model_list"]
+        check_keys(self.payload, keys_to_check)
+
+        self.model_limit = self.payload["model_limit"]
+        self.current_model = self.payload["current_model"]
+        self.model_list = self.payload["model_list"]
+
+    def __str__(self):
+        msg = "CorrectionModelListNot: "
+        msg += " model_limit: {}, ".format(self.model_limit)
+        msg += " current_model: {}, ".format(self.current_model)
+        msg += " model_list: {}".format(self.model_list)
+        return msg
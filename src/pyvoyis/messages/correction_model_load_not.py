@@ -0,0 +1,28 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message, check_keys
+
+
+class CorrectionModelLoadNot(API500Message):
+    __slots__ = ("accepted", "model_name", "error")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        keys_to_check = ["accepted", "model_name", "error"]
+        check_keys(self.payload, keys_to_check)
+
+        self.accepted = self.payload["accepted"]
+        self.model_name = self.payload["model_name"]
+        self.error = self.payload["error"]
+
+    def __str__(self):
+        msg = "CorrectionModelLoadNot: "
+        msg += " accepted: {}, ".format(self.accepted)
+        msg += " model_name: {}, ".format(self.model_name)
+        msg += " error: {}".format(self.error)
+        return msg
@@ -0,0 +1,59 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.api500.defs import endpoint_id_to_str
+from pyvoyis.messages.api500_message import check_keys
+
+
+class EndpointConfiguration:
+    __slots__ = (
+        "endpoint_id",
+        "net_enabled",
+        "net_connection",
+        "file_enabled",
+        "file_name",
+        "file_max_bytes",
+    )
+
+    def __init__(self, json_dict):
+        keys_to_check = [
+            "endpoint_id",
+            "net_enabled",
+            "net_connection",
+            "file_enabled",
+            "file_name",
+            "file_max_bytes",
+        ]
+        check_keys(json_dict, keys_to_check)
+
+        self.endpoint_id = json_dict["endpoint_id"]
+        self.net_enabled = json_dict["net_enabled"]
+        self.net_connection = json_dict["net_connection"]
+        self.file_enabled = json_dict["file_enabled"]
+        self.file_name = json_dict["file_name"]
+        self.file_max_bytes = json_dict["file_max_bytes"]
+
+    def __str__(self) -> str:
+        msg = "EndpointConfiguration: "
+        msg += " endpoint_id: {}, ".format(self.endpoint_id)
+        msg += " net_enabled: {}, ".format(self.net_enabled)
+        msg += " net_connection: {}, ".format(self.net_connection)
+        msg += " file_enabled: {}, ".format(self.file_enabled)
+        msg += " file_name: {}, ".format(self.file_name)
+        msg += " file_max_bytes: {}".format(self.file_max_bytes)
+        return msg
+
+    def to_yaml(self):
+        msg = endpoint_id_to_str(self.endpoint_id) + ":"
+        msg += "\n    endpoint_id: " + str(self.endpoint_id)
+        msg += "\n    net_enabled: " + str(self.net_enabled)
+        msg += "\n    net_connection: " + str(self.net_connection)
+        msg += "\n    file_enabled: " + str(self.file_enabled)
+        msg += "\n    file_name: " + str(self.file_name)
+        msg += "\n    file_max_bytes: " + str(self.file_max_bytes)
+        msg += "\n"
+        return msg
@@ -0,0 +1,22 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+from pyvoyis.messages.endpoint_configuration import EndpointConfiguration
+
+
+class EndpointConfigurationNot(API500Message):
+    __slots__ = ("endpoint_configurations",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.endpoint_configurations = []
+        for p in self.payload:
+            self.endpoint_configurations.append(EndpointConfiguration(p))
+
+    def __str__(self):
+        return "EndpointConfigurationNot: {}".format(self.endpoint_configurations)
@@ -0,0 +1,20 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+
+
+class LeakDetectionNot(API500Message):
+    __slots__ = ("leak_detected", "ch_leak_count")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.leak_detected = self.payload["ch_leak_count"] > 0
+        self.ch_leak_count = self.payload["ch_leak_count"]
+
+    def __str__(self):
+        return "LeakDetectionNot: {}".format(self.leak_detected)
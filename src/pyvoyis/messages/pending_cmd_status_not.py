@@ -0,0 +1,28 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message, check_keys
+
+
+class PendingCmdStatusNot(API500Message):
+    __slots__ = ("completeness", "time_remaining", "command_id")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        keys_to_check = ["completeness", "time_remaining", "command_id"]
+        check_keys(self.payload, keys_to_check)
+
+        self.completeness = self.payload["completeness"]
+        self.time_remaining = self.payload["time_remaining"]
+        self.command_id = self.payload["command_id"]
+
+    def __str__(self):
+        msg = "PendingCmdStatusNot: "
+        msg += " completeness: {}, ".format(self.completeness)
+        msg += " time_remaining: {}, ".format(self.time_remaining)
+        msg += " command_id: {}".format(self.command_id)
+        return msg
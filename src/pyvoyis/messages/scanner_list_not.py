@@ -0,0 +1,29 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+
+
+class ScannerListNot(API500Message):
+    __slots__ = ("ip_addresses", "connection_states")
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.ip_addresses = []
+        self.connection_states = []
+
+        for p in self.payload:
+            ip_address = p["ip_address"]
+            connection_state = p["connection_state"]
+            self.ip_addresses.append(ip_address)
+            self.connection_states.append(connection_state)
+
+    def size(self):
+        return len(self.ip_addresses)
+
+    def __str__(self):
+        return "ScannerListNot: {}".format(self.ip_addresses)
@@ -0,0 +1,90 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.api500.defs import scanner_param_to_str
+from pyvoyis.messages.api500_message import check_keys
+from pyvoyis.messages.value_history import ValueHistory
+
+
+class ScannerParameter:
+    __slots__ = (
+        "parameter_id",
+        "name",
+        "value_type",
+        "remote_value",
+        "local_value",
+        "valid_min",
+        "valid_max",
+        "valid_step",
+        "category_id",
+        "category_name",
+        "can_set_when_scanning",
+    )
+
+    def __init__(self, json_dict):
+        keys_to_check = [
+            "parameter_id",
+            "name",
+            "value_type",
+            "remote_value",
+            "local_value",
+            "valid_min",
+            "valid_max",
+            "valid_step",
+            "category_id",
+            "category_name",
+            "can_set_when_scanning",
+        ]
+        check_keys(json_dict, keys_to_check)
+
+        self.parameter_id = json_dict["parameter_id"]
+        self.name = json_dict["name"]
+        self.value_type = json_dict["value_type"]
+        self.remote_value = ValueHistory(json_dict["remote_value"])
+        self.local_value = ValueHistory(json_dict["local_value"])
+        self.valid_min = json_dict["valid_min"]
+        self.valid_max = json_dict["valid_max"]
+        self.valid_step = json_dict["valid_step"]
+        self.category_id = json_dict["category_id"]
+        self.category_name = json_dict["category_name"]
+        self.can_set_when_scanning = json_dict["can_set_when_scanning"]
+
+    def update(self, other):
+        changed = self.remote_value.add(other.remote_value.get())
+        # Record both fields, then report whether either of them changed
+        return self.local_value.add(other.local_value.get()) or changed
+
+    def __str__(self):
+        msg = "ScannerParameter: "
+        msg += " parameter_id: {}, ".format(self.parameter_id)
+        msg += " name: {}, ".format(self.name)
+        msg += " value_type: {}, ".format(self.value_type)
+        msg += " remote_value: {}, ".format(self.remote_value)
+        msg += " local_value: {}, ".format(self.local_value)
+        msg += " valid_min: {}, ".format(self.valid_min)
+        msg += " valid_max: {}, ".format(self.valid_max)
+        msg += " valid_step: {}, ".format(self.valid_step)
+        msg += " category_id: {}, ".format(self.category_id)
+        msg += " category_name: {}, ".format(self.category_name)
+        msg += " can_set_when_scanning: {}, ".format(self.can_set_when_scanning)
+        return msg
+
+    def to_yaml(self):
+        msg = scanner_param_to_str(self.parameter_id) + ":"
+        msg += "\n    parameter_id: " + str(self.parameter_id)
+        msg += "\n    name: " + str(self.name)
+        msg += "\n    value_type: " + str(self.value_type)
+        msg += "\n    remote_value: " + str(self.remote_value)
+        msg += "\n    local_value: " + str(self.local_value)
+        msg += "\n    valid_min: " + str(self.valid_min)
+        msg += "\n    valid_max: " + str(self.valid_max)
+        msg += "\n    valid_step: " + str(self.valid_step)
+        msg += "\n    category_id: " + str(self.category_id)
+        msg += "\n    category_name: " + str(self.category_name)
+        msg += "\n    can_set_when_scanning: " + str(self.can_set_when_scanning)
+        msg += "\n"
+        return msg
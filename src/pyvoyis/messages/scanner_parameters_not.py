@@ -0,0 +1,22 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+from pyvoyis.messages.scanner_parameter import ScannerParameter
+
+
+class ScannerParametersNot(API500Message):
+    __slots__ = ("parameters",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.parameters = []
+        for p in self.payload:
+            self.parameters.append(ScannerParameter(p))
+
+    def __str__(self):
+        return "ScannerParametersNot: {}".format(self.parameters)
@@ -0,0 +1,70 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.api500.defs import scanner_status_to_str
+from pyvoyis.messages.api500_message import check_keys
+from pyvoyis.messages.value_history import ValueHistory
+
+
+class ScannerStatus:
+    __slots__ = (
+        "status_id",
+        "name",
+        "value_type",
+        "value",
+        "status_status",
+        "category_id",
+        "category_name",
+    )
+
+    def __init__(self, json_dict):
+        keys_to_check = [
+            "status_id",
+            "name",
+            "value_type",
+            "value",
+            "status_status",
+            "category_id",
+            "category_name",
+        ]
+        check_keys(json_dict, keys_to_check)
+
+        self.status_id = json_dict["status_id"]
+        self.name = json_dict["name"]
+        self.value_type = json_dict["value_type"]
+        self.value = ValueHistory(json_dict["value"])
+        self.status_status = ValueHistory(json_dict["status_status"])
+        self.category_id = json_dict["category_id"]
+        self.category_name = json_dict["category_name"]
+
+    def update(self, other):
+        changed = self.value.add(other.value.get())
+        # Record both fields, then report whether either of them changed
+        return self.status_status.add(other.status_status.get()) or changed
+
+    def __str__(self) -> str:
+        msg = "ScannerStatus: "
+        msg += " status_id: {}, ".format(self.status_id)
+        msg += " name: {}, ".format(self.name)
+        msg += " value_type: {}, ".format(self.value_type)
+        msg += " value: {}, ".format(self.value)
+        msg += " status_status: {}, ".format(self.status_status)
+        msg += " category_id: {}, ".format(self.category_id)
+        msg += " category_name: {}, ".format(self.category_name)
+        return msg
+
+    def to_yaml(self):
+        msg = scanner_status_to_str(self.status_id) + ":"
+        msg += "\n    status_id: " + str(self.status_id)
+        msg += "\n    name: " + str(self.name)
+        msg += "\n    value_type: " + str(self.value_type)
+        msg += "\n    value: " + str(self.value)
+        msg += "\n    status_status: " + str(self.status_status)
+        msg += "\n    category_id: " + str(self.category_id)
+        msg += "\n    category_name: " + str(self.category_name)
+        msg += "\n"
+        return msg
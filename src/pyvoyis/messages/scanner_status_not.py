@@ -0,0 +1,28 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+from pyvoyis.messages.api500_message import API500Message
+from pyvoyis.messages.scanner_status import ScannerStatus
+
+
+class ScannerStatusNot(API500Message):
+    __slots__ = ("statuses",)
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.statuses = []
+        for p in self.payload:
+            self.statuses.append(ScannerStatus(p))
+
+    def get(self, status_id):
+        for s in self.statuses:
+            if s.status_id == status_id:
+                return s
+        return None
+
+    def __str__(self):
+        return "ScannerStatusNot: {}".format(self.statuses)
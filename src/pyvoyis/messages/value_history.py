@@ -0,0 +1,59 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import datetime
+
+
+class ValueHistory:
+    __slots__ = ("values", "times", "last_seen", "_str")
+
+    def __init__(self, value=None):
+        """Class to record a history of values and times."""
+        self.values = []
+        self.times = []
+        # Time the value was last reported, changed or not
+        self.last_seen = None
+        # Text of the history, None when it has to be built again
+        self._str = None
+        if value is not None:
+            # Get current time in epoch
+            time = datetime.datetime.now().timestamp()
+            self.values.append(value)
+            self.times.append(time)
+            self.last_seen = time
+
+    def add(self, value):
+        """Record a value if it differs from the last one.
+
+        Repeated values only update last_seen. Returns True if the value was
+        recorded, False if it was a repeat."""
+        time = datetime.datetime.now().timestamp()
+        self.last_seen = time
+        if self.values and self.values[-1] == value:
+            return False
+        self.values.append(value)
+        self.times.append(time)
+        self._str = None
+        return True
+
+    def get(self, index=-1, return_time=False):
+        if return_time:
+            return self.values[index], self.times[index]
+        else:
+            return self.values[index]
+
+    def size(self):
+        return len(self.values)
+
+    def __str__(self):
+        # add() drops the text when the value changes, repeats only change
+        # last_seen, which is formatted every time
+        if self._str is None:
+            msg = "\n        values: {}, ".format(self.values)
+            msg += "\n        times: {}".format(self.times)
+            self._str = msg
+        return self._str + "\n        last_seen: {}".format(self.last_seen)
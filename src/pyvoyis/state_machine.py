@@ -5,83 +5,174 @@ Licensed under the GPLv3 License.
 See LICENSE.md file in the project root for full license information.
 """
 
-from statemachine import State, StateMachine
-
-
-class VoyisAPIStateMachine(StateMachine):
-    idling = State("Idling", initial=True)
-    connecting = State("Connecting")
-    configuring = State("Configuring")
-    readying = State("Ready")
-    requesting_acquisition = State("Requesting acquisition")
-    acquiring = State("Acquiring")
-    requesting_stop = State("Requesting stop")
-    stopping = State("Stopping")
-    disconnecting = State("Disconnecting")
-
-    connect = idling.to(connecting)
-    configure = connecting.to(configuring)
-    ready = configuring.to(readying)
-    request_acquisition = readying.to(requesting_acquisition)
-    acquire = requesting_acquisition.to(acquiring)
-    request_stop = acquiring.to(requesting_stop)
-    stop = requesting_stop.to(stopping)
-    disconnect = stopping.to(disconnecting)
-    reset = (
-        connecting.to(idling)
-        | configuring.to(idling)
-        | readying.to(idling)
-        | requesting_acquisition.to(idling)
-        | acquiring.to(idling)
-        | requesting_stop.to(idling)
-        | stopping.to(idling)
-        | disconnecting.to(idling)
-        | idling.to(idling)
-    )
+
+class TransitionNotAllowed(Exception):
+    def __init__(self, event, state):
+        self.event = event
+        self.state = state
+        super().__init__("Can't {} when in {}.".format(event, state.name))
+
+
+class State:
+    __slots__ = ("id", "name", "value")
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+        self.value = id
+
+    def __repr__(self):
+        return "State({!r}, id={!r})".format(self.name, self.id)
+
+
+IDLING = State("idling", "Idling")
+CONNECTING = State("connecting", "Connecting")
+CONFIGURING = State("configuring", "Configuring")
+READYING = State("readying", "Ready")
+REQUESTING_ACQUISITION = State("requesting_acquisition", "Requesting acquisition")
+ACQUIRING = State("acquiring", "Acquiring")
+REQUESTING_STOP = State("requesting_stop", "Requesting stop")
+STOPPING = State("stopping", "Stopping")
+DISCONNECTING = State("disconnecting", "Disconnecting")
+
+STATES = (
+    IDLING,
+    CONNECTING,
+    CONFIGURING,
+    READYING,
+    REQUESTING_ACQUISITION,
+    ACQUIRING,
+    REQUESTING_STOP,
+    STOPPING,
+    DISCONNECTING,
+)
+
+# (source state, event) -> target state
+_FSM = {
+    (IDLING, "connect"): CONNECTING,
+    (CONNECTING, "configure"): CONFIGURING,
+    (CONFIGURING, "ready"): READYING,
+    (READYING, "request_acquisition"): REQUESTING_ACQUISITION,
+    (REQUESTING_ACQUISITION, "acquire"): ACQUIRING,
+    (ACQUIRING, "request_stop"): REQUESTING_STOP,
+    (REQUESTING_STOP, "stop"): STOPPING,
+    (STOPPING, "disconnect"): DISCONNECTING,
+}
+# Any state can be reset back to idling
+_FSM.update({(state, "reset"): IDLING for state in STATES})
+
+
+class VoyisAPIStateMachine:
+    __slots__ = ("current_state",)
+
+    idling = IDLING
+    connecting = CONNECTING
+    configuring = CONFIGURING
+    readying = READYING
+    requesting_acquisition = REQUESTING_ACQUISITION
+    acquiring = ACQUIRING
+    requesting_stop = REQUESTING_STOP
+    stopping = STOPPING
+    disconnecting = DISCONNECTING
+
+    def __init__(self):
+        self.current_state = IDLING
+
+    def send(self, event, message=""):
+        """Run a transition from the current state
+
+        Parameters
+        ----------
+        event : str
+            Name of the transition, e.g. "connect" or "reset"
+        message : str, optional
+            Text appended to the returned description
+
+        Returns
+        -------
+        str
+            Description of the transition that was run
+        """
+        source = self.current_state
+        target = _FSM.get((source, event))
+        if target is None:
+            raise TransitionNotAllowed(event, source)
+        self.current_state = target
+        return self.before_cycle(event, source, target, message)
 
     def before_cycle(self, event: str, source: State, target: State, message: str = ""):
         message = ". " + message if message else ""
         return f"Running {event} from {source.id} to {target.id}{message}"
 
+    def connect(self, message=""):
+        return self.send("connect", message)
+
+    def configure(self, message=""):
+        return self.send("configure", message)
+
+    def ready(self, message=""):
+        return self.send("ready", message)
+
+    def request_acquisition(self, message=""):
+        return self.send("request_acquisition", message)
+
+    def acquire(self, message=""):
+        return self.send("acquire", message)
+
+    def request_stop(self, message=""):
+        return self.send("request_stop", message)
+
+    def stop(self, message=""):
+        return self.send("stop", message)
+
+    def disconnect(self, message=""):
+        return self.send("disconnect", message)
+
+    def reset(self, message=""):
+        return self.send("reset", message)
+
+    @property
+    def current_state_value(self):
+        return self.current_state.value
+
     @property
     def requires_connection(self):
         return (
-            self.current_state != self.idling
-            and self.current_state != self.disconnecting
+            self.current_state is not IDLING and self.current_state is not DISCONNECTING
         )
 
     @property
     def is_idling(self):
-        return self.current_state == self.idling
+        return self.current_state is IDLING
 
     @property
     def is_connecting(self):
-        return self.current_state == self.connecting
+        return self.current_state is CONNECTING
 
     @property
     def is_configuring(self):
-        return self.current_state == self.configuring
+        return self.current_state is CONFIGURING
 
     @property
     def is_readying(self):
-        return self.current_state == self.readying
+        return self.current_state is READYING
 
     @property
     def is_requesting_acquisition(self):
-        return self.current_state == self.requesting_acquisition
+        return self.current_state is REQUESTING_ACQUISITION
 
     @property
     def is_acquiring(self):
-        return self.current_state == self.acquiring
+        return self.current_state is ACQUIRING
 
     @property
     def is_requesting_stop(self):
-        return self.current_state == self.requesting_stop
+        return self.current_state is REQUESTING_STOP
 
     @property
     def is_stopping(self):
-        return self.current_state == self.stopping
+        return self.current_state is STOPPING
 
     @property
     def is_disconnecting(self):
-        return self.current_state == self.disconnecting
+        return self.current_state is DISCONNECTING
@@ -1,2 +1,6 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
 def bool2str(b, true_str="true", false_str="false"):
     return true_str if b else false_str
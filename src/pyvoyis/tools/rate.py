@@ -6,12 +6,11 @@ See LICENSE.md file in the project root for full license information.
 """
 
 import time
-from datetime import datetime
 
 
 def get_time():
-    stamp = datetime.utcnow()
-    return float(datetime.timestamp(stamp))
+    # Monotonic clock, wall-clock adjustments must not stretch or skip sleeps
+    return time.monotonic()
 
 
 class Rate:
@@ -19,6 +18,8 @@ class Rate:
     Convenience class for sleeping in a loop at a specified rate
     """
 
+    __slots__ = ("last_time", "sleep_dur")
+
     def __init__(self, frequency_hz):
         """
         Constructor.
@@ -43,7 +43,7 @@ def safe_get(dict, key):
 
     log = logging.getLogger("VoyisAPI")
     if len(names) == 1:
-        log.warning(f"Key {names[0]} NOT FOUND")
+        log.warning("Key %s NOT FOUND", names[0])
     else:
-        log.warning(f"Key{names[1]} in {names[0]} NOT FOUND")
+        log.warning("Key%s in %s NOT FOUND", names[1], names[0])
     return None
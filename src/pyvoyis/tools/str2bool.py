@@ -1,2 +1,6 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
 def str2bool(v):
     return v.lower() in ("true", "1")
@@ -0,0 +1,239 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import contextlib
+import io
+import queue
+import tempfile
+import unittest
+
+from pyvoyis.api import VoyisAPI
+from pyvoyis.api500.defs import (
+    SCANNER_STATUS_CONNECTED,
+    SCANNER_STATUS_LASER_CAMERA_CONNECTED,
+    SCANNER_STATUS_LASER_CAMERA_READY,
+    SCANNER_STATUS_LASER_CONNECTED,
+    SCANNER_STATUS_LASER_READY,
+    SCANNER_STATUS_LED_PANEL_CONNECTED,
+    SCANNER_STATUS_LED_PANEL_READY,
+    SCANNER_STATUS_READY,
+    SCANNER_STATUS_SCAN_IN_PROGRESS,
+    SCANNER_STATUS_STILLS_CAMERA_CONNECTED,
+    SCANNER_STATUS_STILLS_CAMERA_READY,
+)
+from pyvoyis.configuration import Configuration
+
+_TMP_DIR = None
+
+
+def setUpModule():
+    global _TMP_DIR
+    _TMP_DIR = tempfile.TemporaryDirectory()
+
+
+def tearDownModule():
+    _TMP_DIR.cleanup()
+
+
+def make_api():
+    """VoyisAPI writing its logs to a temporary folder, without a client"""
+    config = Configuration()
+    config.log_path = _TMP_DIR.name
+    config.endpoint_id.base_path = _TMP_DIR.name
+    with contextlib.redirect_stdout(io.StringIO()):
+        return VoyisAPI(config)
+
+
+def ack_rsp(accepted, command_id):
+    return {
+        "message": "AckRsp",
+        "payload": {
+            "accepted": accepted,
+            "command_id": command_id,
+            "nack_error_code": 0,
+            "nack_error_string": "" if accepted else "Bad parameter",
+            "api_version": "1",
+        },
+    }
+
+
+class FakeServer:
+    """Answers the commands submitted by a VoyisAPI with AckRsp
+
+    replies maps a command name to the answer to each time it is sent: True
+    or False for an accepted or rejected AckRsp, None to lose the AckRsp.
+    """
+
+    def __init__(self, api, replies):
+        self.api = api
+        self.replies = replies
+        self.sent = []
+        api._submit = self.submit
+
+    def submit(self, cmd, timeout_s):
+        self.sent.append(cmd.command)
+        accepted = self.replies[cmd.command].pop(0)
+        if accepted is not None:
+            self.api._handle_ack_rsp(ack_rsp(accepted, len(self.sent)))
+
+
+def scanner_status_not(values):
+    """ScannerStatusNot reporting the given status id -> bool values"""
+    return {
+        "message": "ScannerStatusNot",
+        "payload": [
+            {
+                "status_id": status_id,
+                "name": "status",
+                "value_type": 0,
+                "value": "true" if value else "false",
+                "status_status": 0,
+                "category_id": 0,
+                "category_name": "scanner",
+            }
+            for status_id, value in values.items()
+        ],
+    }
+
+
+class TestSendMessagesBatch(unittest.TestCase):
+    def setUp(self):
+        self.api = make_api()
+        self.cmds = [
+            self.api.cmd.disable_nas,
+            self.api.cmd.disable_local_storage,
+            self.api.cmd.query_scanner_status,
+        ]
+
+    def test_acks_matched_in_order(self):
+        server = FakeServer(
+            self.api,
+            {
+                "DisableNASCmd": [True],
+                "DisableLocalStorageCmd": [False],
+                "QueryScannerStatusCmd": [True],
+            },
+        )
+        with self.assertLogs("VoyisAPI", level="INFO"):
+            results = self.api.send_messages_batch(self.cmds, timeout_s=0.05)
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(
+            server.sent,
+            ["DisableNASCmd", "DisableLocalStorageCmd", "QueryScannerStatusCmd"],
+        )
+
+    def test_missing_ack_resends_only_unacked_commands(self):
+        server = FakeServer(
+            self.api,
+            {
+                "DisableNASCmd": [True],
+                "DisableLocalStorageCmd": [False],
+                "QueryScannerStatusCmd": [None, True],
+            },
+        )
+        with self.assertLogs("VoyisAPI", level="INFO") as logs:
+            results = self.api.send_messages_batch(self.cmds, timeout_s=0.05)
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(
+            server.sent,
+            [
+                "DisableNASCmd",
+                "DisableLocalStorageCmd",
+                "QueryScannerStatusCmd",
+                "QueryScannerStatusCmd",
+            ],
+        )
+        self.assertTrue(
+            any(
+                "No AckRsp received for QueryScannerStatusCmd" in m for m in logs.output
+            )
+        )
+
+
+class TestStopScanningIfRunning(unittest.TestCase):
+    def test_refused_stop_does_not_query_status(self):
+        api = make_api()
+        server = FakeServer(api, {"StopScannerCmd": [False]})
+        api.process_message(
+            scanner_status_not({SCANNER_STATUS_SCAN_IN_PROGRESS: False})
+        )
+        with self.assertLogs("VoyisAPI", level="INFO"):
+            self.assertTrue(api.stop_scanning_if_running())
+        self.assertEqual(server.sent, ["StopScannerCmd"])
+
+
+def api_status_not(value):
+    return {
+        "message": "APIStatusNot",
+        "payload": [
+            {"status_id": 0, "name": "status", "value_type": 3, "value": value}
+        ],
+    }
+
+
+class TestMergeSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.api = make_api()
+
+    def queued(self):
+        names = []
+        while True:
+            try:
+                names.append(self.api._snapshot_q.get_nowait())
+            except queue.Empty:
+                return names
+
+    def test_snapshot_queued_only_when_a_value_changes(self):
+        self.api.process_message(api_status_not("1"))
+        self.assertEqual(self.queued(), ["api_status_not"])
+        # The same value again is recorded as seen, the file is not rewritten
+        self.api.process_message(api_status_not("1"))
+        self.assertEqual(self.queued(), [])
+        self.api.process_message(api_status_not("2"))
+        self.assertEqual(self.queued(), ["api_status_not"])
+        self.assertEqual(self.api.api_status_not_dict[0].value.values, ["1", "2"])
+
+
+class TestPerformSystemChecks(unittest.TestCase):
+    def setUp(self):
+        self.api = make_api()
+        FakeServer(
+            self.api,
+            {"QueryScannerParametersCmd": [True], "QueryScannerStatusCmd": [True]},
+        )
+        # Everything connected and ready except the laser
+        status = dict.fromkeys(
+            (
+                SCANNER_STATUS_CONNECTED,
+                SCANNER_STATUS_READY,
+                SCANNER_STATUS_STILLS_CAMERA_CONNECTED,
+                SCANNER_STATUS_STILLS_CAMERA_READY,
+                SCANNER_STATUS_LASER_CAMERA_CONNECTED,
+                SCANNER_STATUS_LASER_CAMERA_READY,
+                SCANNER_STATUS_LASER_CONNECTED,
+                SCANNER_STATUS_LED_PANEL_CONNECTED,
+                SCANNER_STATUS_LED_PANEL_READY,
+            ),
+            True,
+        )
+        status[SCANNER_STATUS_LASER_READY] = False
+        self.api.process_message(scanner_status_not(status))
+
+    def test_used_device_not_ready(self):
+        self.api.config.parameters.laser_gain_percentage = 100
+        with self.assertLogs("VoyisAPI", level="INFO"):
+            self.assertFalse(self.api.perform_system_checks())
+
+    def test_unused_device_not_ready(self):
+        self.api.config.parameters.laser_gain_percentage = 0
+        with self.assertLogs("VoyisAPI", level="INFO") as logs:
+            self.assertTrue(self.api.perform_system_checks())
+        self.assertIn("Laser: Connected NOT Ready (not used)", "\n".join(logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
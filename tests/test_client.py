@@ -0,0 +1,61 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import asyncio
+import json
+import queue
+import unittest
+
+from pyvoyis.api500.client import API500ClientProtocol
+
+
+class TestDataReceived(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.received = queue.SimpleQueue()
+        self.protocol = API500ClientProtocol(self.loop, self.received)
+
+    def tearDown(self):
+        self.protocol.task.cancel()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def get_received(self):
+        messages = []
+        while not self.received.empty():
+            messages.append(self.received.get_nowait())
+        return messages
+
+    def test_malformed_object_between_valid_ones(self):
+        first = {"message": "AckRsp", "payload": {"accepted": True}}
+        last = {"message": "ScannerStatusNot", "payload": []}
+        malformed = '{\n  "message": "ApiVersionNot",\n  "payload": {"version": \n}'
+        data = json.dumps(first, indent=2) + malformed + json.dumps(last, indent=2)
+        with self.assertLogs("API500ClientProtocol", level="WARNING"):
+            self.protocol.data_received(data.encode("utf-8"))
+        self.assertEqual(self.get_received(), [first, last])
+
+    def test_whitespace_between_objects(self):
+        first = {"message": "AckRsp", "payload": {"accepted": True}}
+        last = {"message": "ScannerStatusNot", "payload": []}
+        data = json.dumps(first, indent=2) + " \r\n\t" + json.dumps(last, indent=2)
+        self.protocol.data_received(data.encode("utf-8"))
+        self.assertEqual(self.get_received(), [first, last])
+
+    def test_object_split_across_chunks(self):
+        first = {"message": "AckRsp", "payload": {"accepted": True}}
+        last = {"message": "ScannerStatusNot", "payload": ["}{"]}
+        data = (json.dumps(first, indent=2) + json.dumps(last, indent=2)).encode()
+        cut = len(data) // 2 + 3
+        self.protocol.data_received(data[:cut])
+        self.assertEqual(self.get_received(), [])
+        self.protocol.data_received(data[cut:])
+        self.assertEqual(self.get_received(), [first, last])
+
+
+if __name__ == "__main__":
+    unittest.main()
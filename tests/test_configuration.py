@@ -0,0 +1,47 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import os
+import tempfile
+import unittest
+
+from pyvoyis.configuration import Configuration
+
+
+class TestFromFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "pyvoyis.yaml")
+        self.write(port=4875, mtime_ns=1_000_000_000)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, port, mtime_ns):
+        with open(self.path, "w") as f:
+            f.write("ip_address: 192.168.10.26\nport: {}\n".format(port))
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_returns_independent_copies(self):
+        first = Configuration.from_file(self.path)
+        first.port = 1
+        second = Configuration.from_file(self.path)
+        self.assertEqual(second.port, 4875)
+        self.assertEqual(second.ip_address, "192.168.10.26")
+
+    def test_reloaded_when_the_file_changes(self):
+        self.assertEqual(Configuration.from_file(self.path).port, 4875)
+        self.write(port=4876, mtime_ns=2_000_000_000)
+        self.assertEqual(Configuration.from_file(self.path).port, 4876)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            Configuration.from_file(os.path.join(self.tmp_dir.name, "missing.yaml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+
+def run_python(code):
+    """Run code in a fresh interpreter, where nothing of pyvoyis is imported yet"""
+    subprocess.run([sys.executable, "-c", textwrap.dedent(code)], check=True)
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_submodules_imported_on_first_access(self):
+        run_python("""
+            import sys
+            import pyvoyis
+
+            assert "pyvoyis.api" not in sys.modules
+            assert "pyvoyis.configuration" not in sys.modules
+            from pyvoyis.api import VoyisAPI
+
+            assert pyvoyis.VoyisAPI is VoyisAPI
+            assert "VoyisAPI" in vars(pyvoyis)
+            """)
+
+    def test_exports(self):
+        import pyvoyis
+        import pyvoyis.messages
+        from pyvoyis.commander import VoyisCommander
+        from pyvoyis.configuration import Configuration
+
+        self.assertIs(pyvoyis.VoyisCommander, VoyisCommander)
+        self.assertIs(pyvoyis.Configuration, Configuration)
+        self.assertIs(pyvoyis.messages, sys.modules["pyvoyis.messages"])
+        # Message classes are still reachable from the top-level package
+        self.assertIs(pyvoyis.AckRsp, pyvoyis.messages.AckRsp)
+        self.assertIs(pyvoyis.ValueHistory, pyvoyis.messages.ValueHistory)
+        for name in pyvoyis.__all__:
+            self.assertIn(name, dir(pyvoyis))
+
+    def test_unknown_name(self):
+        import pyvoyis
+
+        with self.assertRaises(AttributeError):
+            pyvoyis.NotAnExport
+
+    def test_version(self):
+        import pyvoyis
+
+        self.assertIsInstance(pyvoyis.__version__, str)
+        self.assertIn("__version__", vars(pyvoyis))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import unittest
+
+from pyvoyis.state_machine import STATES, TransitionNotAllowed, VoyisAPIStateMachine
+
+# Events in the order the API runs them, and the state each one leads to
+_CYCLE = (
+    ("connect", "connecting"),
+    ("configure", "configuring"),
+    ("ready", "readying"),
+    ("request_acquisition", "requesting_acquisition"),
+    ("acquire", "acquiring"),
+    ("request_stop", "requesting_stop"),
+    ("stop", "stopping"),
+    ("disconnect", "disconnecting"),
+)
+# State each event of _CYCLE is run from
+_SOURCES = ("idling",) + tuple(target for _, target in _CYCLE[:-1])
+_EVENTS = tuple(event for event, _ in _CYCLE) + ("reset",)
+
+
+def machine_in(state_id):
+    """State machine brought to state_id through the allowed transitions"""
+    sm = VoyisAPIStateMachine()
+    for event, _ in _CYCLE:
+        if sm.current_state.id == state_id:
+            break
+        getattr(sm, event)()
+    assert sm.current_state.id == state_id
+    return sm
+
+
+class TestVoyisAPIStateMachine(unittest.TestCase):
+    def test_starts_idling(self):
+        sm = VoyisAPIStateMachine()
+        self.assertIs(sm.current_state, sm.idling)
+        self.assertEqual(sm.current_state_value, "idling")
+
+    def test_allowed_transitions(self):
+        sm = VoyisAPIStateMachine()
+        source = sm.current_state
+        for event, target in _CYCLE:
+            message = getattr(sm, event)("because")
+            self.assertEqual(sm.current_state.id, target)
+            self.assertEqual(
+                message,
+                "Running {} from {} to {}. because".format(event, source.id, target),
+            )
+            source = sm.current_state
+
+    def test_send_runs_the_same_transitions(self):
+        sm = VoyisAPIStateMachine()
+        for source, (event, target) in zip(_SOURCES, _CYCLE):
+            self.assertEqual(
+                sm.send(event), "Running {} from {} to {}".format(event, source, target)
+            )
+            self.assertEqual(sm.current_state.id, target)
+
+    def test_reset_from_every_state(self):
+        for state in STATES:
+            sm = machine_in(state.id)
+            sm.reset()
+            self.assertIs(sm.current_state, sm.idling)
+
+    def test_disallowed_events_raise(self):
+        allowed = {(source, event) for source, (event, _) in zip(_SOURCES, _CYCLE)}
+        for state in STATES:
+            for event in _EVENTS:
+                if event == "reset" or (state.id, event) in allowed:
+                    continue
+                sm = machine_in(state.id)
+                with self.assertRaises(TransitionNotAllowed) as cm:
+                    sm.send(event)
+                self.assertEqual(cm.exception.event, event)
+                self.assertIs(cm.exception.state, state)
+                # A refused event leaves the state as it was
+                self.assertIs(sm.current_state, state)
+
+    def test_unknown_event_raises(self):
+        with self.assertRaises(TransitionNotAllowed):
+            VoyisAPIStateMachine().send("fly")
+
+    def test_is_properties(self):
+        for state in STATES:
+            sm = machine_in(state.id)
+            for other in STATES:
+                self.assertEqual(
+                    getattr(sm, "is_" + other.id), other is state, (state, other)
+                )
+
+    def test_requires_connection(self):
+        for state in STATES:
+            sm = machine_in(state.id)
+            self.assertEqual(
+                sm.requires_connection,
+                state.id not in ("idling", "disconnecting"),
+                state,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Copyright (c) 2023, Miquel Massot
+All rights reserved.
+Licensed under the GPLv3 License.
+See LICENSE.md file in the project root for full license information.
+"""
+
+import unittest
+
+from pyvoyis.messages.value_history import ValueHistory
+
+
+class TestValueHistory(unittest.TestCase):
+    def test_add_records_only_changes(self):
+        history = ValueHistory("a")
+        self.assertFalse(history.add("a"))
+        self.assertTrue(history.add("b"))
+        self.assertEqual(history.values, ["a", "b"])
+        self.assertEqual(len(history.times), 2)
+        self.assertGreaterEqual(history.last_seen, history.times[-1])
+
+    def test_repeat_updates_last_seen(self):
+        history = ValueHistory("a")
+        first_seen = history.last_seen
+        history.add("a")
+        self.assertGreaterEqual(history.last_seen, first_seen)
+        self.assertIn("last_seen: {}".format(history.last_seen), str(history))
+
+    def test_str_is_reused_while_unchanged(self):
+        history = ValueHistory("a")
+        str(history)
+        cached = history._str
+        history.add("a")
+        str(history)
+        self.assertIs(history._str, cached)
+        history.add("b")
+        self.assertIn("'b'", str(history))
+        self.assertIsNot(history._str, cached)
+
+
+if __name__ == "__main__":
+    unittest.main()